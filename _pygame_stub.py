@@ -0,0 +1,30 @@
+# ═══════════════════════════════════════════════════════════════════════════
+# Woggle Test Pygame Stub
+# Installs a MagicMock in place of pygame so game modules can be imported in
+# tests without display/audio initialization. Importing this module is
+# enough; the stub is built once and shared by every test module.
+# ═══════════════════════════════════════════════════════════════════════════
+
+import sys
+from unittest.mock import MagicMock
+
+if 'pygame' not in sys.modules:
+    pygame_mock = MagicMock()
+    pygame_mock.init = MagicMock()
+    pygame_mock.mixer = MagicMock()
+    pygame_mock.mixer.init = MagicMock()
+    pygame_mock.mixer.get_init = MagicMock(return_value=(48000, -16, 2))
+    pygame_mock.font = MagicMock()
+    pygame_mock.display = MagicMock()
+    pygame_mock.sndarray = MagicMock()
+    pygame_mock.sndarray.make_sound = MagicMock(return_value=MagicMock())
+    pygame_mock.Rect = MagicMock()
+    pygame_mock.time = MagicMock()
+    pygame_mock.time.get_ticks = MagicMock(return_value=0)
+    pygame_mock.image = MagicMock()
+    pygame_mock.image.load = MagicMock(side_effect=Exception("No image"))
+    pygame_mock.NOFRAME = 0
+    pygame_mock.QUIT = 256
+    pygame_mock.KEYDOWN = 768
+    pygame_mock.MOUSEBUTTONDOWN = 1025
+    sys.modules['pygame'] = pygame_mock
@@ -0,0 +1,205 @@
+# ═══════════════════════════════════════════════════════════════════════════
+# Woggle Numba Solver Kernel
+# Optional JIT-compiled word-enumeration kernel for the board solver.
+# The dictionary trie is flattened into parallel int arrays and the board is
+# encoded as letter indices so the whole DFS runs on unboxed integers.
+# Numba is optional: when it is not installed, HAVE_NUMBA is False and
+# callers fall back to the pure-Python solver.
+# ═══════════════════════════════════════════════════════════════════════════
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba not installed - callers use the Python solver
+    njit = None
+
+HAVE_NUMBA = njit is not None
+
+GRID_SIZE = 4
+
+# Letter encoding: 'A'..'Z' -> 0..25, the "Qu" tile -> 26 (descended as two
+# trie steps, Q then U, so trie column 26 itself is never used).
+QU_CODE = 26
+_Q = ord("Q") - ord("A")
+_U = ord("U") - ord("A")
+
+# Flat CSR-style neighbor table for the 4x4 board: neighbors of cell i are
+# _NB_FLAT[_NB_OFF[i]:_NB_OFF[i + 1]].
+_neighbors = [
+    [
+        (r + dr) * GRID_SIZE + (c + dc)
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+        if (dr or dc) and 0 <= r + dr < GRID_SIZE and 0 <= c + dc < GRID_SIZE
+    ]
+    for r in range(GRID_SIZE)
+    for c in range(GRID_SIZE)
+]
+_NB_FLAT = np.array([n for nbrs in _neighbors for n in nbrs], dtype=np.int32)
+_NB_OFF = np.cumsum([0] + [len(nbrs) for nbrs in _neighbors]).astype(np.int32)
+
+
+def build_flat_trie(words):
+    """
+    Flatten a dictionary into parallel trie arrays for the JIT kernel.
+
+    Words shorter than 3 letters can never be emitted by the solver and are
+    excluded up front, as are words with any character outside A-Z (the
+    dictionary loader's lenient decoding admits apostrophes and accented
+    letters, but no such word is formable from A-Z/Qu tiles and their codes
+    would index outside the 27-column trie).
+
+    Args:
+        words: Iterable of uppercase word strings
+
+    Returns:
+        (children, word_id, vocab) where children is an int32 array of shape
+        (n_nodes, 27) holding child node indices (-1 for absent), word_id is
+        an int32 array mapping terminal nodes to indices into vocab (-1 for
+        non-terminal nodes), and vocab is the sorted list of words.
+    """
+    vocab = sorted(w for w in words if len(w) >= 3 and w.isascii() and w.isalpha())
+
+    children_rows = [[-1] * 27]
+    word_id = [-1]
+    for i, word in enumerate(vocab):
+        node = 0
+        for ch in word:
+            letter = ord(ch) - 65
+            child = children_rows[node][letter]
+            if child < 0:
+                child = len(children_rows)
+                children_rows[node][letter] = child
+                children_rows.append([-1] * 27)
+                word_id.append(-1)
+            node = child
+        word_id[node] = i
+
+    children = np.array(children_rows, dtype=np.int32)
+    return children, np.array(word_id, dtype=np.int32), vocab
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _descend(children, node, letter):
+        """Advance one trie edge for a letter code (two edges for Qu)."""
+        if letter == QU_CODE:
+            node = children[node, _Q]
+            if node < 0:
+                return -1
+            return children[node, _U]
+        return children[node, letter]
+
+    @njit(cache=True)
+    def _solve(board, children, word_id, nb_flat, nb_off, found):
+        """
+        Enumerate all board words into the `found` flag array.
+
+        Iterative DFS with a fixed-size explicit stack; visited cells are a
+        16-bit mask so all state is unboxed integers.
+        """
+        stack = np.empty((256, 3), dtype=np.int32)
+        for start in range(16):
+            node = _descend(children, 0, board[start])
+            if node < 0:
+                continue
+            stack[0, 0] = start
+            stack[0, 1] = 1 << start
+            stack[0, 2] = node
+            top = 1
+            while top > 0:
+                top -= 1
+                pos = stack[top, 0]
+                visited = stack[top, 1]
+                node = stack[top, 2]
+                wid = word_id[node]
+                if wid >= 0:
+                    found[wid] = 1
+                for k in range(nb_off[pos], nb_off[pos + 1]):
+                    new_pos = nb_flat[k]
+                    if not (visited >> new_pos) & 1:
+                        child = _descend(children, node, board[new_pos])
+                        if child >= 0:
+                            stack[top, 0] = new_pos
+                            stack[top, 1] = visited | (1 << new_pos)
+                            stack[top, 2] = child
+                            top += 1
+
+
+def solve_board_python(board, children, word_id, vocab):
+    """
+    Pure-Python driver over the flat trie arrays.
+
+    Same DFS as the JIT kernel, but runs without Numba: indexed reads from
+    the contiguous children array replace the dict lookups of a node-based
+    trie, so the flat layout pays off even un-jitted.
+
+    Args:
+        board: Flat list of 16 'A'..'Z' / 'Qu' tile strings
+        children, word_id, vocab: Flat trie from build_flat_trie
+
+    Returns:
+        Sorted list of all possible words
+    """
+    codes = encode_board(board)
+
+    def descend(node, letter):
+        if letter == QU_CODE:
+            node = children[node, _Q]
+            if node < 0:
+                return -1
+            return children[node, _U]
+        return children[node, letter]
+
+    found_bits = 0
+    stack = []
+    for start in range(16):
+        node = descend(0, codes[start])
+        if node >= 0:
+            stack.append((start, 1 << start, node))
+
+    while stack:
+        pos, visited, node = stack.pop()
+        wid = word_id[node]
+        if wid >= 0:
+            # int() keeps found_bits an arbitrary-width Python int rather
+            # than letting the numpy scalar cap the shift at 32 bits
+            found_bits |= 1 << int(wid)
+        for new_pos in _neighbors[pos]:
+            if not (visited >> new_pos) & 1:
+                child = descend(node, codes[new_pos])
+                if child >= 0:
+                    stack.append((new_pos, visited | (1 << new_pos), child))
+
+    result = []
+    while found_bits:
+        low = found_bits & -found_bits
+        result.append(vocab[low.bit_length() - 1])
+        found_bits ^= low
+    return result
+
+
+def encode_board(board):
+    """Encode a 16-tile board of 'A'..'Z' / 'Qu' strings as int8 letter codes."""
+    return np.array(
+        [QU_CODE if b in ("Qu", "QU") else ord(b) - 65 for b in board],
+        dtype=np.int8,
+    )
+
+
+def solve_board(board, children, word_id, vocab):
+    """
+    Find all words on a board using the JIT kernel.
+
+    Args:
+        board: Flat list of 16 'A'..'Z' / 'Qu' tile strings
+        children, word_id, vocab: Flat trie from build_flat_trie
+
+    Returns:
+        Sorted list of all possible words
+    """
+    found = np.zeros(len(vocab), dtype=np.uint8)
+    _solve(encode_board(board), children, word_id, _NB_FLAT, _NB_OFF, found)
+    return [vocab[i] for i in np.nonzero(found)[0]]
@@ -5,29 +5,14 @@
 # ═══════════════════════════════════════════════════════════════════════════
 
 import unittest
-from unittest.mock import MagicMock
-import sys
-
-# Mock pygame before importing woggle to avoid display initialization
-pygame_mock = MagicMock()
-pygame_mock.init = MagicMock()
-pygame_mock.mixer = MagicMock()
-pygame_mock.mixer.init = MagicMock()
-pygame_mock.mixer.get_init = MagicMock(return_value=(48000, -16, 2))
-pygame_mock.font = MagicMock()
-pygame_mock.display = MagicMock()
-pygame_mock.sndarray = MagicMock()
-pygame_mock.sndarray.make_sound = MagicMock(return_value=MagicMock())
-pygame_mock.Rect = MagicMock()
-pygame_mock.time = MagicMock()
-pygame_mock.time.get_ticks = MagicMock(return_value=0)
-pygame_mock.image = MagicMock()
-pygame_mock.image.load = MagicMock(side_effect=Exception("No image"))
-pygame_mock.NOFRAME = 0
-pygame_mock.QUIT = 256
-pygame_mock.KEYDOWN = 768
-pygame_mock.MOUSEBUTTONDOWN = 1025
-sys.modules['pygame'] = pygame_mock
+
+import numpy as np
+
+# Mock pygame before importing woggle to avoid display initialization;
+# the stub module installs the shared mock into sys.modules exactly once
+import _pygame_stub  # noqa: F401
+
+import _solver_numba
 
 # ───────────────────────────────────────────────────────────────────────────
 # STANDALONE IMPLEMENTATIONS FOR TESTING
@@ -36,6 +21,24 @@ sys.modules['pygame'] = pygame_mock
 
 GRID_SIZE = 4
 
+# Precomputed neighbor indices for every cell of the 4x4 board. NEIGHBORS[i]
+# is a tuple of the flat indices adjacent to cell i (including diagonals),
+# replacing the nested dr/dc loop, bounds checks, and divmod in the DFS.
+NEIGHBORS = tuple(
+    tuple(
+        (r + dr) * GRID_SIZE + (c + dc)
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+        if (dr or dc) and 0 <= r + dr < GRID_SIZE and 0 <= c + dc < GRID_SIZE
+    )
+    for r in range(GRID_SIZE)
+    for c in range(GRID_SIZE)
+)
+
+# Bitmask form of the adjacency table: bit b of ADJ[a] is set iff cell b is
+# adjacent to cell a, collapsing adjacency checks to a single AND.
+ADJ = tuple(sum(1 << n for n in nbrs) for nbrs in NEIGHBORS)
+
 # Standard Boggle dice configuration
 CUBES = [
     ["A", "A", "C", "I", "O", "T"],
@@ -57,10 +60,24 @@ CUBES = [
 ]
 
 
+def is_adjacent_idx(a, b):
+    """
+    Check if two flat board indices (0-15) are adjacent (including diagonals).
+
+    Args:
+        a, b: Flat board indices
+
+    Returns:
+        True if positions are adjacent, False otherwise
+    """
+    return bool(ADJ[a] & (1 << b))
+
+
 def is_adjacent_pure(pos1, pos2):
     """
     Check if two board positions are adjacent (including diagonals).
-    Pure logic without sound effects.
+    Pure logic without sound effects; thin (row, col) wrapper over the
+    precomputed ADJ bitmask table.
 
     Args:
         pos1, pos2: Tuples of (row, col) coordinates
@@ -68,9 +85,7 @@ def is_adjacent_pure(pos1, pos2):
     Returns:
         True if positions are adjacent, False otherwise
     """
-    r1, c1 = pos1
-    r2, c2 = pos2
-    return max(abs(r1 - r2), abs(c1 - c2)) == 1 and pos1 != pos2
+    return bool(ADJ[pos1[0] * GRID_SIZE + pos1[1]] & (1 << (pos2[0] * GRID_SIZE + pos2[1])))
 
 
 def is_valid_word_pure(word, board, path, dictionary):
@@ -99,10 +114,19 @@ def is_valid_word_pure(word, board, path, dictionary):
     if len(word) != expected_word_length:
         return False
 
-    # Verify all positions are adjacent
-    for i in range(1, len(path)):
-        if not is_adjacent_pure(path[i-1], path[i]):
+    # Verify the path in one bitmask walk: each step must be adjacent to the
+    # previous cell (single AND against ADJ) and no cell may repeat
+    visited_mask = 0
+    prev = -1
+    for r, c in path:
+        idx = r * GRID_SIZE + c
+        bit = 1 << idx
+        if visited_mask & bit:
+            return False
+        if prev >= 0 and not ADJ[prev] & bit:
             return False
+        visited_mask |= bit
+        prev = idx
 
     return True
 
@@ -111,27 +135,56 @@ def calculate_score(tile_count):
     """
     Calculate score for a word based on tile count.
 
+    One comparison plus a tuple index; matches the game's PTS_TABLE, where
+    even sub-3-tile counts score 1 (a 2-tile path is legal via the Qu tile,
+    e.g. "QUA").
+
     Args:
         tile_count: Number of tiles used (path length)
 
     Returns:
         Point value for the word
     """
-    if tile_count <= 4:
-        return 1
-    elif tile_count == 5:
-        return 2
-    elif tile_count == 6:
-        return 3
-    elif tile_count == 7:
-        return 5
-    else:
-        return 11
+    return (1, 1, 1, 1, 1, 2, 3, 5)[tile_count] if tile_count < 8 else 11
+
+
+# The dice packed as one contiguous 96-byte table of letter codes
+# ('A'..'Z' -> 0..25, "Qu" -> 26): byte cube*6 + face is that die face.
+QU_CODE = 26
+CUBES_PACKED = bytes(
+    QU_CODE if face == "Qu" else ord(face) - 65 for cube in CUBES for face in cube
+)
+_CUBES_U8 = np.frombuffer(CUBES_PACKED, dtype=np.uint8).reshape(len(CUBES), 6)
+
+# Decode table from letter code back to the die face string
+FACE_STRINGS = tuple(chr(65 + i) for i in range(26)) + ("Qu",)
+
+
+def generate_board_indices(seed=None):
+    """
+    Generate a random 4x4 Boggle board as letter codes.
+
+    Two vectorized RNG calls (one permutation of the dice, one batch of face
+    picks) against the packed dice table replace the Python-level shuffle
+    plus 16 random.choice calls; consumers that want int boards can use the
+    result directly.
+
+    Args:
+        seed: Optional random seed for reproducible results
+
+    Returns:
+        uint8 array of 16 letter codes (QU_CODE for the "Qu" face)
+    """
+    rng = np.random.default_rng(seed)
+    perm = rng.permutation(len(CUBES))
+    faces = rng.integers(0, 6, size=len(CUBES))
+    return _CUBES_U8[perm, faces]
 
 
 def generate_board_with_seed(seed=None):
     """
     Generate a random 4x4 Boggle board with optional seed for reproducibility.
+    String-list adapter over generate_board_indices.
 
     Args:
         seed: Optional random seed for reproducible results
@@ -139,63 +192,240 @@ def generate_board_with_seed(seed=None):
     Returns:
         Flat list of 16 letters
     """
-    import random
-    if seed is not None:
-        random.seed(seed)
-    shuffled = CUBES[:]
-    random.shuffle(shuffled)
-    return [random.choice(cube) for cube in shuffled]
+    return [FACE_STRINGS[i] for i in generate_board_indices(seed)]
+
+
+class TrieNode:
+    """
+    A single node of the dictionary trie.
+
+    Each node holds a dict of single-character edges to child nodes.
+    Terminal nodes record their completed word and a dense word id (index
+    into the trie's sorted vocabulary); the root additionally carries that
+    vocabulary so solvers can decode ids back to words.
+    """
+    __slots__ = ("children", "word", "word_id", "vocab")
 
+    def __init__(self):
+        self.children = {}
+        self.word = None
+        self.word_id = -1
+        self.vocab = None
 
-def find_all_possible_words_pure(board, dictionary, prefixes):
+
+def build_trie(words):
+    """
+    Build a trie from an iterable of words.
+
+    Words shorter than 3 letters are never emitted by the solver and are
+    excluded. Terminal nodes are numbered 0..W-1 in sorted-vocabulary order,
+    so a solver can record hits in an int bitvector and decode them in
+    sorted order for free.
+
+    Args:
+        words: Iterable of uppercase word strings
+
+    Returns:
+        Root TrieNode of the trie, with root.vocab set
+    """
+    root = TrieNode()
+    vocab = sorted(w for w in words if len(w) >= 3)
+    for i, word in enumerate(vocab):
+        node = root
+        for ch in word:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = TrieNode()
+            node = child
+        node.word = word
+        node.word_id = i
+    root.vocab = vocab
+    return root
+
+
+def iter_bitvec(bits):
+    """
+    Yield the indices of all set bits of an int, in ascending order.
+
+    Args:
+        bits: Non-negative int bitvector
+
+    Yields:
+        Bit indices with a 1 bit, lowest first
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+# Tries built from a given dictionary object are cached on its identity so
+# repeated solves over the same lexicon (every solve in a real game session)
+# pay the construction cost only once. The dictionary itself is stored in
+# the cache value: that keeps it alive, so a collected set's id can never
+# be reused by a different set and silently hit the stale trie.
+_FLAT_TRIE_CACHE = {}
+
+
+def _get_flat_trie(dictionary):
+    """Return the cached flat Numba trie for a dictionary, building on first use."""
+    cached = _FLAT_TRIE_CACHE.get(id(dictionary))
+    if cached is not None and cached[0] is dictionary:
+        return cached[1]
+    flat = _solver_numba.build_flat_trie(dictionary)
+    _FLAT_TRIE_CACHE[id(dictionary)] = (dictionary, flat)
+    return flat
+
+
+def find_all_possible_words_pure(board, dictionary, prefixes=None):
     """
     Find all valid words that can be formed on the current board.
     Pure implementation without global dependencies.
 
+    Adapter over find_all_possible_words_trie for callers holding a plain
+    word set; the trie built from the set is cached across calls.
+
     Args:
         board: Flat list of 16 letters
         dictionary: Set of valid words
-        prefixes: Set of all valid prefixes
+        prefixes: Unused; retained for signature compatibility (the trie
+            subsumes the prefix set)
 
     Returns:
         Sorted list of all possible words
     """
-    def get_letter(idx):
-        return "QU" if board[idx] == "Qu" else board[idx]
+    # Both paths share the flat array trie: the JIT kernel when Numba is
+    # available, the pure-Python driver over the same arrays otherwise.
+    children, word_id, vocab = _get_flat_trie(dictionary)
+    if _solver_numba.HAVE_NUMBA:
+        return _solver_numba.solve_board(board, children, word_id, vocab)
 
-    def dfs(pos, visited, current_word):
-        if len(current_word) > 16:
-            return
+    return _solver_numba.solve_board_python(board, children, word_id, vocab)
 
-        letter = get_letter(pos)
-        current_word += letter
 
-        if current_word not in prefixes:
-            return
+def find_all_possible_words_iter(board, root):
+    """
+    Yield all valid words on the board lazily, in DFS discovery order.
 
-        if len(current_word) >= 3 and current_word in dictionary:
-            found.add(current_word)
+    Streaming variant of find_all_possible_words_trie for callers that
+    consume results incrementally (e.g. a UI reveal) and want neither the
+    final sort pass nor the materialized result set. Duplicates (words
+    reachable via several paths) are suppressed.
 
-        r, c = divmod(pos, GRID_SIZE)
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == dc == 0:
-                    continue
+    Args:
+        board: Flat list of 16 letters
+        root: Root TrieNode built by build_trie
+
+    Yields:
+        Word strings as they are discovered
+    """
+    letters = [("QU" if b == "Qu" else b) for b in board]
 
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < 4 and 0 <= nc < 4:
-                    new_pos = nr * 4 + nc
-                    if new_pos not in visited:
-                        visited.add(new_pos)
-                        dfs(new_pos, visited, current_word)
-                        visited.remove(new_pos)
+    def descend(node, letter):
+        for ch in letter:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
 
-    found = set()
+    seen = set()
+    stack = []
+    for start_pos in range(16):
+        node = descend(root, letters[start_pos])
+        if node is not None:
+            stack.append((start_pos, 1 << start_pos, node))
+
+    while stack:
+        pos, visited, node = stack.pop()
+        word = node.word
+        if word is not None and word not in seen:
+            seen.add(word)
+            yield word
+        for new_pos in NEIGHBORS[pos]:
+            if not (visited >> new_pos) & 1:
+                child = descend(node, letters[new_pos])
+                if child is not None:
+                    stack.append((new_pos, visited | (1 << new_pos), child))
+
+
+def find_all_possible_words_trie(board, root):
+    """
+    Find all valid words that can be formed on the current board.
+
+    Primary solver API for callers that already hold a trie: the DFS carries
+    a trie node and advances one child lookup per character, so both the
+    prefix check and the word membership check are a single O(1) pointer
+    chase instead of hashing the growing word string against two large sets.
+
+    Args:
+        board: Flat list of 16 letters
+        root: Root TrieNode built by build_trie
+
+    Returns:
+        Sorted list of all possible words
+    """
+    # Flatten the board into a plain indexable table once, instead of paying
+    # a closure call and a "Qu" branch on every DFS step
+    letters = [("QU" if b == "Qu" else b) for b in board]
+
+    def descend(node, letter):
+        """Advance one trie edge per character ("QU" advances two)."""
+        for ch in letter:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    # Iterative DFS over an explicit stack of (pos, visited_mask, trie_node)
+    # entries: avoids a CPython frame allocation and argument binding per
+    # expansion while preserving DFS order. Visited cells live in a 16-bit
+    # mask, so no backtracking removal is needed. Hits are recorded as one
+    # OR into an int bitvector indexed by dense word id - no string hashing,
+    # no result set - and decoded against the sorted vocabulary at the end,
+    # which also makes the final sorted() pass unnecessary.
+    # Memoize the root descent per distinct letter: boards repeat letters,
+    # and starts whose letter has no trie child are skipped without ever
+    # entering the DFS.
+    found_bits = 0
+    start_nodes = {}
+    stack = []
     for start_pos in range(16):
-        visited = {start_pos}
-        dfs(start_pos, visited, "")
+        letter = letters[start_pos]
+        if letter in start_nodes:
+            node = start_nodes[letter]
+        else:
+            node = start_nodes[letter] = descend(root, letter)
+        if node is not None:
+            stack.append((start_pos, 1 << start_pos, node))
+
+    while stack:
+        pos, visited, node = stack.pop()
+        if node.word_id >= 0:
+            found_bits |= 1 << node.word_id
+        for new_pos in NEIGHBORS[pos]:
+            if not (visited >> new_pos) & 1:
+                child = descend(node, letters[new_pos])
+                if child is not None:
+                    stack.append((new_pos, visited | (1 << new_pos), child))
+
+    vocab = root.vocab
+    return [vocab[i] for i in iter_bitvec(found_bits)]
+
+
+def _index_starts(board):
+    """
+    Map each letter's first character to the board cells holding it.
 
-    return sorted(found)
+    Args:
+        board: Flat list of 16 letters
+
+    Returns:
+        Dict of uppercase first character to list of flat cell indices
+    """
+    by_first = {}
+    for i, b in enumerate(board):
+        by_first.setdefault(b[0].upper(), []).append(i)
+    return by_first
 
 
 def find_path_for_word_pure(target, board):
@@ -210,46 +440,51 @@ def find_path_for_word_pure(target, board):
         List of (row, col) positions forming the word, or None if not found
     """
     target = target.upper()
+    target_len = len(target)
+    if target_len == 0:
+        return None
 
-    def get_letter(idx):
-        l = board[idx]
-        return "QU" if l == "Qu" else l
+    # Precomputed letter table; see find_all_possible_words_trie
+    letters = [("QU" if b == "Qu" else b) for b in board]
 
-    def dfs(pos, path, current):
-        if current == target:
+    def matches(letter, depth):
+        """Check that `letter` matches target at `depth` - O(1) per step."""
+        if target[depth] != letter[0]:
+            return False
+        if len(letter) == 2:
+            return depth + 1 < target_len and target[depth + 1] == letter[1]
+        return True
+
+    def dfs(pos, path, depth, visited_mask):
+        # `depth` is the number of target characters matched so far; indexed
+        # comparison replaces startswith over the whole accumulated prefix
+        # and the per-step string concatenation.
+        if depth == target_len:
             return path[:]
 
-        if len(current) >= len(target):
-            return None
-
-        r, c = divmod(pos, GRID_SIZE)
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == dc == 0:
-                    continue
-
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < 4 and 0 <= nc < 4:
-                    np_idx = nr * 4 + nc
-
-                    if np_idx not in {p[0] * 4 + p[1] for p in path}:
-                        next_l = get_letter(np_idx)
-                        new = current + next_l
+        for np_idx in NEIGHBORS[pos]:
+            # Path membership is carried as a bitmask rather than
+            # rebuilt from the path list on every probe
+            if not (visited_mask >> np_idx) & 1:
+                next_l = letters[np_idx]
 
-                        if target.startswith(new):
-                            path.append((nr, nc))
-                            res = dfs(np_idx, path, new)
-                            if res:
-                                return res
-                            path.pop()
+                if matches(next_l, depth):
+                    path.append(divmod(np_idx, GRID_SIZE))
+                    res = dfs(np_idx, path, depth + len(next_l),
+                              visited_mask | (1 << np_idx))
+                    if res:
+                        return res
+                    path.pop()
 
         return None
 
-    for start in range(16):
-        start_l = get_letter(start)
-        if target.startswith(start_l):
+    # Only start from cells whose letter begins the target, via a one-pass
+    # first-character index instead of probing all 16 cells
+    for start in _index_starts(board).get(target[0], ()):
+        start_l = letters[start]
+        if len(start_l) <= target_len and matches(start_l, 0):
             sr, sc = divmod(start, 4)
-            res = dfs(start, [(sr, sc)], start_l)
+            res = dfs(start, [(sr, sc)], len(start_l), 1 << start)
             if res:
                 return res
 
@@ -309,6 +544,10 @@ class TestAdjacency(unittest.TestCase):
 class TestScoring(unittest.TestCase):
     """Tests for the scoring system"""
 
+    def test_2_tile_qu_word(self):
+        """2-tile words (reachable via the Qu tile, e.g. QUA) score 1 point"""
+        self.assertEqual(calculate_score(2), 1)
+
     def test_3_tile_word(self):
         """3-tile words score 1 point"""
         self.assertEqual(calculate_score(3), 1)
@@ -432,11 +671,9 @@ class TestWordFinding(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
+        # The solver prunes via a trie built (and cached) from the
+        # dictionary, so no prefix set needs to be materialized here.
         self.dictionary = {"CAT", "COD", "DOG", "GOD", "TAO", "OAT", "ADO"}
-        self.prefixes = set()
-        for word in self.dictionary:
-            for i in range(1, len(word) + 1):
-                self.prefixes.add(word[:i])
 
         # Simple test board:
         # C A T O
@@ -450,18 +687,18 @@ class TestWordFinding(unittest.TestCase):
 
     def test_finds_simple_words(self):
         """Should find simple horizontal/vertical words"""
-        found = find_all_possible_words_pure(self.board, self.dictionary, self.prefixes)
+        found = find_all_possible_words_pure(self.board, self.dictionary)
         self.assertIn("CAT", found)
 
     def test_finds_diagonal_words(self):
         """Should find words using diagonal paths"""
-        found = find_all_possible_words_pure(self.board, self.dictionary, self.prefixes)
+        found = find_all_possible_words_pure(self.board, self.dictionary)
         # COD: C(0,0) -> O(1,1) -> D(1,0)
         self.assertIn("COD", found)
 
     def test_finds_all_valid_words(self):
         """Should find multiple valid words"""
-        found = find_all_possible_words_pure(self.board, self.dictionary, self.prefixes)
+        found = find_all_possible_words_pure(self.board, self.dictionary)
         # These should all be findable on this board
         self.assertIn("CAT", found)
         self.assertIn("DOG", found)
@@ -469,15 +706,123 @@ class TestWordFinding(unittest.TestCase):
 
     def test_returns_sorted_list(self):
         """Results should be sorted alphabetically"""
-        found = find_all_possible_words_pure(self.board, self.dictionary, self.prefixes)
+        found = find_all_possible_words_pure(self.board, self.dictionary)
         self.assertEqual(found, sorted(found))
 
     def test_no_duplicate_words(self):
         """Should not return duplicate words even if multiple paths exist"""
-        found = find_all_possible_words_pure(self.board, self.dictionary, self.prefixes)
+        found = find_all_possible_words_pure(self.board, self.dictionary)
         self.assertEqual(len(found), len(set(found)))
 
 
+class TestTrieSolver(unittest.TestCase):
+    """Tests for build_trie and find_all_possible_words_trie"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.dictionary = {"CAT", "COD", "DOG", "GOD", "TAO", "OAT", "ADO"}
+        # Same board as TestWordFinding:
+        # C A T O
+        # D O G X
+        self.board = ["C", "A", "T", "O",
+                      "D", "O", "G", "X",
+                      "X", "X", "X", "X",
+                      "X", "X", "X", "X"]
+        self.root = build_trie(self.dictionary)
+
+    def test_vocab_is_sorted(self):
+        """build_trie should number terminals against a sorted vocabulary"""
+        self.assertEqual(self.root.vocab, sorted(self.dictionary))
+
+    def test_finds_expected_words(self):
+        """Trie solver should find the same words as the pure solver"""
+        found = find_all_possible_words_trie(self.board, self.root)
+        self.assertEqual(found,
+                         find_all_possible_words_pure(self.board, self.dictionary))
+
+    def test_returns_sorted_list(self):
+        """Results should be sorted alphabetically"""
+        found = find_all_possible_words_trie(self.board, self.root)
+        self.assertEqual(found, sorted(found))
+
+    def test_qu_tile_handling(self):
+        """Qu tiles should descend the Q and U trie edges"""
+        board = ["Qu", "A", "X", "X",
+                 "D", "O", "X", "X",
+                 "X", "X", "X", "X",
+                 "X", "X", "X", "X"]
+        root = build_trie({"QUA", "QUAD", "QUOD"})
+        found = find_all_possible_words_trie(board, root)
+        self.assertIn("QUA", found)
+        self.assertIn("QUAD", found)
+
+
+class TestIterSolver(unittest.TestCase):
+    """Tests for the streaming find_all_possible_words_iter variant"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.dictionary = {"CAT", "COD", "DOG", "GOD", "TAO", "OAT", "ADO"}
+        self.board = ["C", "A", "T", "O",
+                      "D", "O", "G", "X",
+                      "X", "X", "X", "X",
+                      "X", "X", "X", "X"]
+        self.root = build_trie(self.dictionary)
+
+    def test_yields_same_words_as_trie_solver(self):
+        """Streaming variant should yield exactly the trie solver's words"""
+        streamed = sorted(find_all_possible_words_iter(self.board, self.root))
+        self.assertEqual(streamed,
+                         find_all_possible_words_trie(self.board, self.root))
+
+    def test_no_duplicate_words(self):
+        """Words reachable via several paths should be yielded once"""
+        streamed = list(find_all_possible_words_iter(self.board, self.root))
+        self.assertEqual(len(streamed), len(set(streamed)))
+
+    def test_is_lazy(self):
+        """The variant should yield incrementally, not materialize a list"""
+        it = find_all_possible_words_iter(self.board, self.root)
+        self.assertNotIsInstance(it, list)
+        self.assertIn(next(it), self.dictionary)
+
+
+class TestPythonFallbackDriver(unittest.TestCase):
+    """Tests for the pure-Python driver over the flat trie arrays"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.dictionary = {"CAT", "COD", "DOG", "GOD", "TAO", "OAT", "ADO"}
+        self.board = ["C", "A", "T", "O",
+                      "D", "O", "G", "X",
+                      "X", "X", "X", "X",
+                      "X", "X", "X", "X"]
+        self.flat = _solver_numba.build_flat_trie(self.dictionary)
+
+    def test_finds_expected_words(self):
+        """Fallback driver should agree with the TrieNode solver"""
+        found = _solver_numba.solve_board_python(self.board, *self.flat)
+        self.assertEqual(found,
+                         find_all_possible_words_trie(self.board,
+                                                      build_trie(self.dictionary)))
+
+    def test_returns_sorted_list(self):
+        """Results should be sorted alphabetically"""
+        found = _solver_numba.solve_board_python(self.board, *self.flat)
+        self.assertEqual(found, sorted(found))
+
+    def test_qu_tile_handling(self):
+        """Qu tiles should descend the Q and U trie columns"""
+        board = ["Qu", "A", "X", "X",
+                 "D", "O", "X", "X",
+                 "X", "X", "X", "X",
+                 "X", "X", "X", "X"]
+        flat = _solver_numba.build_flat_trie({"QUA", "QUAD", "QUOD"})
+        found = _solver_numba.solve_board_python(board, *flat)
+        self.assertIn("QUA", found)
+        self.assertIn("QUAD", found)
+
+
 class TestPathFinding(unittest.TestCase):
     """Tests for finding a specific word's path on the board"""
 
@@ -555,12 +900,7 @@ class TestQuTileHandling(unittest.TestCase):
     def test_qu_in_word_finding(self):
         """Word finder should handle Qu tiles correctly"""
         dictionary = {"QUAD", "QUOD", "QUA"}
-        prefixes = set()
-        for word in dictionary:
-            for i in range(1, len(word) + 1):
-                prefixes.add(word[:i])
-
-        found = find_all_possible_words_pure(self.board, dictionary, prefixes)
+        found = find_all_possible_words_pure(self.board, dictionary)
         # Should find QUA: Qu(0,0) -> A(0,1)
         self.assertIn("QUA", found)
 
@@ -13,11 +13,19 @@
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
 
+import collections
+import concurrent.futures
+import functools
+import os
+import pickle
 import pygame
 import random
 import time
+import wave
 import numpy as np
 
+import _solver_numba
+
 # ───────────────────────────────────────────────────────────────────────────
 # BOGGLE DICE CONFIGURATION
 # Standard Boggle dice with their six faces each. Each die is represented as
@@ -52,20 +60,75 @@ GRID_SIZE = 4
 CELL_SIZE = 100
 GRID_WIDTH = GRID_SIZE * CELL_SIZE + 40  # Add 40 pixels for 20px border on each side
 
+# Precomputed neighbor indices (including diagonals) for each cell of the
+# flat board, plus the index -> (row, col) mapping. The word-search DFS
+# iterates these tables instead of redoing divmod, the dr/dc loops, and
+# four bounds checks at every step.
+NEIGHBORS = tuple(
+    tuple(
+        (r + dr) * GRID_SIZE + (c + dc)
+        for dr in (-1, 0, 1)
+        for dc in (-1, 0, 1)
+        if (dr or dc) and 0 <= r + dr < GRID_SIZE and 0 <= c + dc < GRID_SIZE
+    )
+    for r in range(GRID_SIZE)
+    for c in range(GRID_SIZE)
+)
+POS_RC = tuple(divmod(i, GRID_SIZE) for i in range(GRID_SIZE * GRID_SIZE))
+
+# Pixel center of each cell, indexed [row][col]; used for the cheat-path
+# connecting lines
+CELL_CENTER = tuple(
+    tuple(
+        (c * CELL_SIZE + CELL_SIZE // 2 + 20, r * CELL_SIZE + CELL_SIZE // 2 + 20)
+        for c in range(GRID_SIZE)
+    )
+    for r in range(GRID_SIZE)
+)
+
 # Panel dimensions for sidebars and UI elements
 SIDE_PANEL = 250
 BASE_WIDTH = GRID_WIDTH + SIDE_PANEL
 CHEAT_PANEL_WIDTH = 300
 SCREEN_HEIGHT = GRID_SIZE * CELL_SIZE + 40 + 180  # Add 40 pixels for border
 
+# Invariant layout geometry, hoisted so the event and render loops never
+# rebuild rects or redo the arithmetic per frame
+GRID_AREA_HEIGHT = GRID_SIZE * CELL_SIZE + 40
+GRID_BG_RECT = pygame.Rect(0, 0, GRID_WIDTH, GRID_AREA_HEIGHT)
+
+# Cheat panel layout: the list starts below the heading and the scrollbar
+# hugs the panel's right edge
+CHEAT_TOP = 65
+CHEAT_LINE_H = 24
+CHEAT_H = SCREEN_HEIGHT - 95
+CHEAT_PANEL_RECT = pygame.Rect(BASE_WIDTH, 0, CHEAT_PANEL_WIDTH, SCREEN_HEIGHT)
+CHEAT_AREA_RECT = pygame.Rect(BASE_WIDTH + 5, CHEAT_TOP, CHEAT_PANEL_WIDTH - 10, CHEAT_H)
+CHEAT_CLIP_RECT = CHEAT_AREA_RECT.inflate(-2, -2)
+CHEAT_CLICK_RECT = pygame.Rect(BASE_WIDTH + 5, CHEAT_TOP, CHEAT_PANEL_WIDTH - 30, CHEAT_H)
+CHEAT_SB_X = BASE_WIDTH + CHEAT_PANEL_WIDTH - 20
+
 # Timer configuration
 TIME_LIMIT = 180  # 3 minutes in seconds
 
 # Scrolling configuration
+# Boggle scoring ladder as a lookup table indexed by tile count (clamped
+# to 16, the longest possible path on a 4x4 board)
+PTS_TABLE = (1, 1, 1, 1, 1, 2, 3, 5, 11, 11, 11, 11, 11, 11, 11, 11, 11)
+
 WORD_LINE_HEIGHT = 28
 WORDS_AREA_Y = 70
 WORDS_AREA_HEIGHT = 352
 WORDS_AREA_WIDTH = SIDE_PANEL - 40
+WORDS_AREA_RECT = pygame.Rect(GRID_WIDTH + 10, WORDS_AREA_Y,
+                              WORDS_AREA_WIDTH + 20, WORDS_AREA_HEIGHT)
+# Clip region for list text: the area rect minus its 1px border, so
+# partially scrolled rows are cropped by SDL instead of skipped
+WORDS_CLIP_RECT = WORDS_AREA_RECT.inflate(-2, -2)
+
+# Status text block (score / timer / words-possible) in the sidebar; kept
+# as one rect so timer-tick frames can repaint and present just this region
+STATUS_RECT = pygame.Rect(GRID_WIDTH + 20, GRID_SIZE * CELL_SIZE + 70, SIDE_PANEL - 40, 90)
 
 # Color palette used for UI elements
 WHITE = (255, 255, 255)
@@ -76,6 +139,7 @@ BLUE = (100, 150, 255)
 DARK_BLUE = (70, 120, 220)
 NAVY_BLUE = (20, 60, 140)
 YELLOW = (255, 255, 100)
+CHEAT_HIGHLIGHT = (255, 220, 100)
 RED = (220, 50, 50)
 GREEN = (0, 180, 0)
 SCROLLBAR_COLOR = (120, 120, 120)
@@ -91,112 +155,355 @@ pygame.init()
 pygame.mixer.init(frequency=48000, size=-16, channels=2, buffer=512)
 num_channels = pygame.mixer.get_init()[2]  # Detect actual number of audio channels
 
+# Only the event types the game handles are allowed onto the queue; SDL
+# drops everything else (touch, audio-device, most window events) at the
+# source instead of feeding them through the Python dispatch loop. The
+# expose/restore window events stay allowed: rendering is skipped on
+# eventless frames, so they are what forces a full repaint after the
+# window is uncovered, restored, or first shown.
+pygame.event.set_blocked(None)
+pygame.event.set_allowed([
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEWHEEL,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+])
+
 # ───────────────────────────────────────────────────────────────────────────
 # SOUND GENERATION FUNCTIONS
 # Create procedural sound effects using numpy sine waves for positive and
 # negative feedback. These functions generate short audio clips dynamically.
 # ───────────────────────────────────────────────────────────────────────────
 
-def make_ding():
+# Both effects share one sample rate, duration, and time base; the time
+# vector is computed once and reused by each synthesis call
+_SAMPLE_RATE = 48000
+_TONE_DURATION = 0.075
+_TONE_T = np.linspace(0, _TONE_DURATION, int(_SAMPLE_RATE * _TONE_DURATION), False)
+
+
+def _synth_tone(freq, amplitude, decay, square=False):
     """
-    Generate a pleasant 'ding' sound for positive feedback.
-    Uses a 1500 Hz sine wave with exponential decay for a clean, bell-like tone.
+    Synthesize one exponentially decaying tone as a mixer-ready Sound.
+
+    The waveform is built with in-place multiplies on a single float
+    buffer and cast to int16 once; multi-channel output fans the mono
+    buffer out as a broadcast view rather than physically stacking copies.
+
+    Args:
+        freq: Tone frequency in Hz
+        amplitude: Peak amplitude in 0..1
+        decay: Exponential decay rate (higher dies off faster)
+        square: Clip the sine to a square wave for a harsher tone
+
+    Returns:
+        A pygame.mixer.Sound instance
     """
-    sample_rate = 48000
-    duration = 0.075
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = 0.25 * np.sin(2 * np.pi * 1500 * t) * np.exp(-t * 16)
+    wave_f = np.sin(2 * np.pi * freq * _TONE_T)
+    if square:
+        np.sign(wave_f, out=wave_f)
+    wave_f *= np.exp(_TONE_T * -decay)
+    wave_f *= amplitude * 32767
 
-    # Create mono or multi-channel audio based on system configuration
+    wave_i16 = wave_f.astype(np.int16)
     if num_channels == 1:
-        sound_array = (wave * 32767).astype(np.int16)
+        sound_array = wave_i16
     else:
-        stereo_wave = np.column_stack([wave] * num_channels)
-        sound_array = (stereo_wave * 32767).astype(np.int16)
+        sound_array = np.broadcast_to(wave_i16[:, None], (wave_i16.size, num_channels))
+
+    return pygame.sndarray.make_sound(np.ascontiguousarray(sound_array))
 
-    sound_array = np.ascontiguousarray(sound_array)
-    return pygame.sndarray.make_sound(sound_array)
+
+def make_ding():
+    """
+    Generate a pleasant 'ding' sound for positive feedback.
+    Uses a 1500 Hz sine wave with exponential decay for a clean, bell-like tone.
+    """
+    return _synth_tone(1500, 0.25, 16)
 
 def make_buzzer():
     """
     Generate a 'buzzer' sound for negative feedback.
     Uses a 150 Hz square wave with exponential decay for a harsh, alerting tone.
     """
-    sample_rate = 48000
-    duration = 0.075
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    wave = 0.2 * np.sign(np.sin(2 * np.pi * 150 * t)) * np.exp(-t * 5)
+    return _synth_tone(150, 0.2, 5, square=True)
 
-    # Create mono or multi-channel audio based on system configuration
-    if num_channels == 1:
-        sound_array = (wave * 32767).astype(np.int16)
-    else:
-        stereo_wave = np.column_stack([wave] * num_channels)
-        sound_array = (stereo_wave * 32767).astype(np.int16)
+def _load_or_make(path, generator):
+    """
+    Load a cached sound effect from disk, generating it on first run.
+
+    The waveforms are static, so after the first launch they are read
+    straight from .wav files next to the script and the numpy synthesis
+    is skipped entirely.
 
-    sound_array = np.ascontiguousarray(sound_array)
-    return pygame.sndarray.make_sound(sound_array)
+    Args:
+        path: Filename of the cached .wav
+        generator: Zero-arg function that synthesizes the sound
+
+    Returns:
+        A pygame.mixer.Sound instance
+    """
+    if os.path.exists(path):
+        try:
+            return pygame.mixer.Sound(path)
+        except pygame.error:
+            pass  # Corrupt/unreadable cache - fall through and regenerate
+
+    sound = generator()
+    try:
+        samples = pygame.sndarray.samples(sound)
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(num_channels)
+            wav.setsampwidth(2)  # 16-bit samples
+            wav.setframerate(_SAMPLE_RATE)
+            wav.writeframes(samples.tobytes())
+    except Exception:
+        # Caching is best-effort; drop any partial file so a truncated
+        # cache is never loaded on the next launch
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return sound
 
 # Create sound effect instances for immediate use in the game
-ding_sound = make_ding()
-buzzer_sound = make_buzzer()
+ding_sound = _load_or_make("ding.wav", make_ding)
+buzzer_sound = _load_or_make("buzzer.wav", make_buzzer)
+
+# Rapid-fire clicks can stack the same sample onto several mixer channels
+# within a frame, which distorts the tone and wastes mixing work. A short
+# gate per sound keeps repeat plays at least ~one frame apart.
+_MIN_REPLAY_GAP = 0.02
+_last_ding_ts = 0.0
+_last_buzzer_ts = 0.0
+
+
+def play_ding():
+    """Play the ding sound, dropping sub-frame duplicate triggers."""
+    global _last_ding_ts
+    now = time.monotonic()
+    if now - _last_ding_ts >= _MIN_REPLAY_GAP:
+        ding_sound.play()
+        _last_ding_ts = now
+
+
+def play_buzzer():
+    """Play the buzzer sound, dropping sub-frame duplicate triggers."""
+    global _last_buzzer_ts
+    now = time.monotonic()
+    if now - _last_buzzer_ts >= _MIN_REPLAY_GAP:
+        buzzer_sound.play()
+        _last_buzzer_ts = now
 
 # ───────────────────────────────────────────────────────────────────────────
 # DICTIONARY LOADING
-# Load valid words from an external file named "words" and build a prefix set
-# for fast lookup and pruning during word searches. Only words of 3 or more
-# letters are included.
+# Load valid words from an external file named "words"; a trie is built over
+# them below for fast lookup and pruning during word searches. Only words of
+# 3 or more letters are included.
 # ───────────────────────────────────────────────────────────────────────────
 dictionary = set()
 dictionary_load_error = None
-
+TRIE = None
+_FLAT_TRIE = None
+
+# Parsed-dictionary disk cache, in the same spirit as the tone cache
+# above: on warm launches a single pickle.load replaces both the parse
+# and the trie build. Keyed by the words file's identity, so editing or
+# replacing the file invalidates the cache.
+_DICT_CACHE = "dict_cache.pkl"
 try:
-    with open("words", "r", encoding="utf-8") as f:
-        for line in f:
-            word = line.strip().upper()
-            if word and 3 <= len(word) <= 16:  # Only accept words 3-16 letters
-                dictionary.add(word)
-
-    # Validate dictionary was loaded successfully
-    if len(dictionary) == 0:
-        dictionary_load_error = "Warning: 'words' file is empty or contains no valid words."
-        print(dictionary_load_error)
+    _words_stat = os.stat("words")
+    _dict_key = (_words_stat.st_mtime_ns, _words_stat.st_size)
+except OSError:
+    _dict_key = None
 
-except FileNotFoundError:
-    dictionary_load_error = "Warning: 'words' file not found. Game will run but no words will be valid."
-    print(dictionary_load_error)
 
-except UnicodeDecodeError as e:
-    dictionary_load_error = f"Warning: 'words' file has encoding issues: {e}. Trying alternate encoding..."
-    print(dictionary_load_error)
-    # Try with latin-1 encoding as fallback (handles most Western text)
+def _write_dict_cache():
+    """Persist the parsed dictionary (and flat trie, once built) to disk."""
+    try:
+        with open(_DICT_CACHE, "wb") as _f:
+            pickle.dump((_dict_key, dictionary, TRIE, _FLAT_TRIE), _f,
+                        pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Remove a partial file so a failed write can't poison the
+        # next launch
+        try:
+            os.remove(_DICT_CACHE)
+        except OSError:
+            pass
+
+if _dict_key is not None:
     try:
-        with open("words", "r", encoding="latin-1") as f:
-            for line in f:
-                word = line.strip().upper()
-                if word and 3 <= len(word) <= 16:
-                    dictionary.add(word)
-        if len(dictionary) > 0:
+        with open(_DICT_CACHE, "rb") as _f:
+            _cached_key, _cached_dict, _cached_trie, _cached_flat = pickle.load(_f)
+        if _cached_key == _dict_key:
+            dictionary, TRIE, _FLAT_TRIE = _cached_dict, _cached_trie, _cached_flat
+    except Exception:
+        # Missing, unreadable, or older-format cache; fall through to a
+        # full build
+        pass
+
+if TRIE is None:
+    try:
+        # Read the whole file in one call; decoding, uppercasing, and line
+        # splitting then each run as a single C-level pass over the buffer
+        # instead of one Python-level strip/upper per line.
+        with open("words", "rb") as f:
+            _raw = f.read()
+
+        try:
+            _words_text = _raw.decode("utf-8")
+        except UnicodeDecodeError as e:
+            dictionary_load_error = f"Warning: 'words' file has encoding issues: {e}. Trying alternate encoding..."
+            print(dictionary_load_error)
+            # latin-1 decodes any byte sequence (handles most Western text)
+            _words_text = _raw.decode("latin-1")
+
+        # Only words of 3-16 letters are accepted
+        dictionary = {w for w in _words_text.upper().splitlines() if 3 <= len(w) <= 16}
+
+        if dictionary_load_error is not None and len(dictionary) > 0:
             print(f"Successfully loaded {len(dictionary)} words with fallback encoding.")
             dictionary_load_error = None
-    except Exception as e2:
-        dictionary_load_error = f"Error: Could not load dictionary with fallback encoding: {e2}"
+
+        # Validate dictionary was loaded successfully
+        if len(dictionary) == 0:
+            dictionary_load_error = "Warning: 'words' file is empty or contains no valid words."
+            print(dictionary_load_error)
+
+    except FileNotFoundError:
+        dictionary_load_error = "Warning: 'words' file not found. Game will run but no words will be valid."
         print(dictionary_load_error)
 
-except PermissionError:
-    dictionary_load_error = "Error: Permission denied when trying to read 'words' file."
-    print(dictionary_load_error)
+    except PermissionError:
+        dictionary_load_error = "Error: Permission denied when trying to read 'words' file."
+        print(dictionary_load_error)
 
-except Exception as e:
-    dictionary_load_error = f"Error loading dictionary: {e}"
-    print(dictionary_load_error)
+    except Exception as e:
+        dictionary_load_error = f"Error loading dictionary: {e}"
+        print(dictionary_load_error)
+
+
+    # Build a trie over the dictionary for efficient word search pruning.
+    # Each node is a dict of single-letter edges to child nodes; terminal
+    # nodes store their completed word under the '$' key. The DFS descends
+    # one edge per letter, so pruning and word membership are each a single
+    # dict lookup instead of hashing the growing word against
+    # prefix/dictionary sets.
+    TRIE = {}
+    for word in dictionary:
+        _node = TRIE
+        for _ch in word:
+            _node = _node.setdefault(_ch, {})
+        _node['$'] = word
+
+    if _dict_key is not None and dictionary:
+        _write_dict_cache()
+
+
+def _get_flat_trie():
+    """
+    Return the flat-array trie for the Numba kernel, building it lazily.
+
+    The flatten pass costs seconds and ~100 MB on a full words file, so it
+    only runs when the kernel actually solves a board - never on installs
+    without Numba - and the result is folded into the disk cache so warm
+    launches skip it too.
+    """
+    global _FLAT_TRIE
+    if _FLAT_TRIE is None:
+        _FLAT_TRIE = _solver_numba.build_flat_trie(dictionary)
+        if _dict_key is not None and dictionary:
+            _write_dict_cache()
+    return _FLAT_TRIE
+
+# ───────────────────────────────────────────────────────────────────────────
+# BOARD SOLVER
+# Module-level word search over the dictionary trie. Kept outside GameState
+# so results can be memoized per board: the same board is re-solved on
+# save/load round-trips and by any future caller, and those hits are free.
+# ───────────────────────────────────────────────────────────────────────────
+
+@functools.lru_cache(maxsize=128)
+def _solve_board(board):
+    """
+    Find all dictionary words that can be formed on a board.
+    Depth-first search over the dictionary trie: the search carries a trie
+    node and descends one letter edge per step, so impossible prefixes are
+    pruned with a single dict lookup and no word string is accumulated
+    along the way.
 
-# Build prefix set for efficient word search pruning
-# This dramatically speeds up the DFS search by eliminating impossible paths early
-prefixes = set()
-for word in dictionary:
-    for i in range(1, len(word) + 1):
-        prefixes.add(word[:i])
+    Args:
+        board: Tuple of 16 tile strings ('A'..'Z' or 'Qu'); must be a tuple
+               so boards can key the cache
+
+    Returns:
+        Tuple of all possible words, grouped by length (shortest first) and
+        alphabetical within each length - the order the cheat panel shows
+    """
+    # Prefer the JIT kernel: the whole DFS runs on unboxed integers over
+    # the flat trie arrays, orders of magnitude faster than Python recursion
+    if _solver_numba.HAVE_NUMBA:
+        words = _solver_numba.solve_board(board, *_get_flat_trie())
+        # Already alphabetical; a stable sort on length yields the same
+        # length-then-alpha order as the bucketed fallback below
+        words.sort(key=len)
+        return tuple(words)
+
+    # Expand the 'Qu' tile once per solve instead of branching on every
+    # DFS step
+    board_letters = ["QU" if l == "Qu" else l for l in board]
+    seen = set()
+    found_by_len = [[] for _ in range(17)]
+
+    def descend(node, letters):
+        """Walk one trie edge per letter ("QU" walks two); None when no
+        dictionary word continues this prefix."""
+        for ch in letters:
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    # Explicit-stack DFS: entries are (pos, visited_mask, trie_node) with
+    # the node already descended through pos's letters. Visited cells ride
+    # along as a 16-bit mask, so marking is a shift/or and there is no
+    # state to undo when backtracking - and no Python call frame per step,
+    # which is the bulk of the cost at this depth and branching factor.
+    stack = []
+    for start_pos in range(16):
+        node = descend(TRIE, board_letters[start_pos])
+        if node is not None:
+            stack.append((start_pos, 1 << start_pos, node))
+
+    while stack:
+        pos, visited, node = stack.pop()
+
+        # Terminal marker: dictionary words are 3-16 letters by load-time
+        # filtering, so any '$' hit is a valid word. Bucket by length at
+        # detection time so the return path only sorts small buckets.
+        word = node.get('$')
+        if word is not None and word not in seen:
+            seen.add(word)
+            found_by_len[len(word)].append(word)
+
+        for new_pos in NEIGHBORS[pos]:
+            if not (visited >> new_pos) & 1:
+                child = descend(node, board_letters[new_pos])
+                if child is not None:
+                    stack.append((new_pos, visited | (1 << new_pos), child))
+
+    return tuple(w for bucket in found_by_len for w in sorted(bucket))
+
+# Single worker so at most one board solve runs behind the UI at a time.
+# Solves are submitted here by GameState.reset() and adopted by
+# poll_solver() in the main loop, keeping reshuffles from stalling frames.
+_solver_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 # ───────────────────────────────────────────────────────────────────────────
 # DRAWING HELPER FUNCTIONS
@@ -226,6 +533,167 @@ def draw_rounded_rect(surface, color, rect, border_radius=10, border_width=0, bo
         pygame.draw.rect(surface, border_color, rect, width=border_width, border_radius=border_radius)
 
 
+# Re-rendering text each frame costs a FreeType shaping per string per
+# frame; a blit from this cache is nearly free. The lru_cache bounds memory
+# while holding far more entries than are ever visible at once.
+
+@functools.lru_cache(maxsize=2048)
+def render_cached(font_obj, text, color):
+    """
+    Render text through a bounded cache of glyph surfaces.
+
+    Args:
+        font_obj: The pygame Font to render with
+        text: The string to render
+        color: Text color tuple
+
+    Returns:
+        A pygame.Surface with the rendered text
+    """
+    # convert_alpha puts the glyphs in the display's pixel format so the
+    # cached surfaces blit on SDL's fast path
+    return font_obj.render(text, True, color).convert_alpha()
+
+
+def draw_status(surface, game, time_left):
+    """
+    Repaint the score / timer / words-possible block of the sidebar.
+    Factored out so timer-tick frames can refresh just this region.
+
+    Args:
+        surface: The display surface to draw on
+        game: The active GameState
+        time_left: Seconds remaining on the timer
+    """
+    x, y = STATUS_RECT.topleft
+    surface.fill(WHITE, STATUS_RECT)
+
+    surface.blit(render_cached(small_font, f"Score: {game.score}", BLACK), (x, y))
+    surface.blit(render_cached(small_font, f"Words possible: {len(game.possible_words)}",
+                               (90, 90, 140)), (x, y + 60))
+
+    timer_str = f"Time: {time_left // 60:02d}:{time_left % 60:02d}"
+    timer_color = RED if time_left <= 30 and game.timer_active else BLACK
+    surface.blit(render_cached(small_font, timer_str, timer_color), (x, y + 30))
+
+
+# Thumb geometry for a scrolled list, shared by the hit-test, drag,
+# wheel-clamp, and draw code so the float math lives in one place
+Scrollbar = collections.namedtuple(
+    "Scrollbar", ["content_h", "max_scroll", "thumb_h", "thumb_y", "visible"]
+)
+
+
+def compute_scrollbar(content_h, area_h, area_top, scroll_offset):
+    """
+    Derive scrollbar thumb geometry for a scrolled list.
+
+    Args:
+        content_h: Total pixel height of the list content
+        area_h: Pixel height of the visible area
+        area_top: Y coordinate of the area's top edge
+        scroll_offset: Current (non-positive) scroll offset
+
+    Returns:
+        A Scrollbar namedtuple; visible is False when the content fits and
+        no scrollbar should be shown (max_scroll is then 0)
+    """
+    max_scroll = content_h - area_h
+    if max_scroll <= 0:
+        return Scrollbar(content_h, 0, 0, area_top, False)
+
+    thumb_h = max(30, (area_h / content_h) * area_h)
+    thumb_y = area_top + (-scroll_offset / max_scroll) * (area_h - thumb_h)
+    return Scrollbar(content_h, max_scroll, thumb_h, thumb_y, True)
+
+
+def _build_cell_surface(color):
+    """
+    Bake one cell's chrome (outer and inner rounded rects) in a fill color.
+    The corners are filled black to match the grid background behind the
+    rounding. Converted to the display format for fast-path blits.
+
+    Args:
+        color: Fill color for the cell
+
+    Returns:
+        A CELL_SIZE x CELL_SIZE pygame.Surface
+    """
+    surf = pygame.Surface((CELL_SIZE, CELL_SIZE))
+    surf.fill(BLACK)
+
+    rect = pygame.Rect(0, 0, CELL_SIZE, CELL_SIZE)
+    draw_rounded_rect(surf, color, rect, border_radius=15, border_width=2, border_color=GRAY)
+
+    inner_rect = pygame.Rect(10, 10, CELL_SIZE - 20, CELL_SIZE - 20)
+    draw_rounded_rect(surf, color, inner_rect, border_radius=10, border_width=4, border_color=LIGHT_GRAY)
+
+    return surf.convert()
+
+
+def draw_cell(surface, row, col, color, board):
+    """
+    Draw a single board cell: prebuilt chrome surface plus its letter.
+
+    Args:
+        surface: Surface to draw on
+        row, col: Grid coordinates of the cell
+        color: Fill color for the cell (must be a key of _cell_surfaces)
+        board: Tuple of 16 tile strings
+    """
+    x, y = col * CELL_SIZE + 20, row * CELL_SIZE + 20
+    surface.blit(_cell_surfaces[color], (x, y))
+
+    letter = board[row * GRID_SIZE + col]
+    text = render_cached(font, letter, BLACK)
+    surface.blit(text, text.get_rect(center=(x + CELL_SIZE // 2, y + CELL_SIZE // 2)))
+
+
+def build_grid_surface(board):
+    """
+    Bake the static board chrome - background, border, and all 16 cells
+    with their letter glyphs - into one surface. Rebuilt only when the
+    board changes; each frame blits this and overpaints the few
+    highlighted cells instead of re-drawing the whole grid.
+
+    Args:
+        board: Tuple of 16 tile strings
+
+    Returns:
+        A pygame.Surface covering the grid area
+    """
+    surf = pygame.Surface(GRID_BG_RECT.size)
+
+    pygame.draw.rect(surf, BLACK, GRID_BG_RECT)
+    draw_rounded_rect(surf, BLACK, GRID_BG_RECT, border_radius=15, border_width=20, border_color=NAVY_BLUE)
+
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            draw_cell(surf, row, col, WHITE, board)
+
+    return surf
+
+
+def set_display_mode(size):
+    """
+    Open the game window on SDL's accelerated present path.
+
+    SCALED | DOUBLEBUF with vsync lets SDL hand the finished frame to the
+    GPU compositor instead of a CPU copy; builds or drivers that reject the
+    combination fall back to a plain software window.
+
+    Args:
+        size: (width, height) of the window
+
+    Returns:
+        The display Surface
+    """
+    try:
+        return pygame.display.set_mode(size, pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+    except pygame.error:
+        return pygame.display.set_mode(size)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GAME STATE CLASS
 # Encapsulates all game state and logic in a single class for better
@@ -251,8 +719,14 @@ class GameState:
         """Reset all game state to start a new game."""
         # Board and word tracking
         self.board = self._generate_board()
+        # Tiles with 'Qu' expanded to 'QU', computed once per board so the
+        # hot paths never branch on or re-replace the two-letter tile
+        self.board_letters = ["QU" if l == "Qu" else l for l in self.board]
         self.selected_path = []           # Current word being built by user
-        self.found_words = []             # List of (word, tile_count) tuples
+        self.current_word = ""            # Letters of selected_path, kept in sync
+        self.found_words = []             # List of (word, tile_count, pts) tuples
+        self._found_set = set()           # Word strings in found_words, for O(1) dupe checks
+        self.found_content_h = 0          # len(found_words) * WORD_LINE_HEIGHT, kept in sync
         self.score = 0                    # Current score
 
         # Timer state
@@ -274,18 +748,22 @@ class GameState:
         self.selected_cheat_word = None         # Currently selected word in cheat list
         self.selected_path_from_cheat = []      # Path to show for selected cheat word
 
-        # Possible words cache
-        self.possible_words = self._find_all_possible_words()
+        # Possible words cache; the solve runs on the background worker and
+        # poll_solver() adopts the result, so reshuffling never drops frames
+        self.possible_words = []
+        self.cheat_content_h = 0          # len(possible_words) * CHEAT_LINE_H, kept in sync
+        self._solve_future = _solver_pool.submit(_solve_board, self.board)
 
     def _generate_board(self):
         """
         Generate a random 4x4 Boggle board.
         Shuffles the dice, then picks one random face from each die.
-        Returns a flat list of 16 letters.
+        Returns a flat tuple of 16 letters; boards are immutable between
+        reshuffles, and as tuples they key the solver cache directly.
         """
         shuffled = CUBES[:]
         random.shuffle(shuffled)
-        return [random.choice(cube) for cube in shuffled]
+        return tuple(random.choice(cube) for cube in shuffled)
 
     def reshuffle(self):
         """Generate a new board and reset game state, preserving cheat panel visibility."""
@@ -301,6 +779,8 @@ class GameState:
     def is_adjacent(pos1, pos2):
         """
         Check if two board positions are adjacent (including diagonals).
+        Backed by the precomputed NEIGHBORS table, so the check is a single
+        membership probe instead of abs/max arithmetic.
 
         Args:
             pos1, pos2: Tuples of (row, col) coordinates
@@ -308,19 +788,20 @@ class GameState:
         Returns:
             True if positions are adjacent, False otherwise
         """
-        r1, c1 = pos1
-        r2, c2 = pos2
-        return max(abs(r1 - r2), abs(c1 - c2)) == 1 and pos1 != pos2
+        return pos2[0] * GRID_SIZE + pos2[1] in NEIGHBORS[pos1[0] * GRID_SIZE + pos1[1]]
 
     def is_valid_word(self, word, path):
         """
         Validate that a word is legal according to Boggle rules.
 
         Checks:
-        - Word is at least 3 letters
+        - Word is 3-16 letters
         - Word exists in dictionary
         - Path length matches word length (accounting for "QU")
-        - All positions in path are adjacent
+
+        Path adjacency is a construction-time invariant: select_letter only
+        ever extends the path through is_adjacent, so it is not re-verified
+        here.
 
         Args:
             word: The word string to validate
@@ -329,24 +810,20 @@ class GameState:
         Returns:
             True if word is valid, False otherwise
         """
-        if len(word) < 3 or word not in dictionary:
+        # Cheap length filters first: bounds (the dictionary only holds
+        # 3-16 letter words) and the path/word length match. The dictionary
+        # probe - the only O(len) operation here - runs last, so rejected
+        # submissions never hash the string at all.
+        word_len = len(word)
+        if word_len < 3 or word_len > 16:
             return False
 
-        # Count how many "Qu" tiles are in the path
-        qu_count = sum(1 for r, c in path if self.board[r * GRID_SIZE + c] == "Qu")
-
         # Expected word length = path length + number of "Qu" tiles
-        expected_word_length = len(path) + qu_count
-
-        if len(word) != expected_word_length:
+        qu_count = sum(1 for r, c in path if self.board[r * GRID_SIZE + c] == "Qu")
+        if word_len != len(path) + qu_count:
             return False
 
-        # Verify all positions are adjacent
-        for i in range(1, len(path)):
-            if not self.is_adjacent(path[i-1], path[i]):
-                return False
-
-        return True
+        return word in dictionary
 
     # ───────────────────────────────────────────────────────────────────────
     # SCORING
@@ -363,16 +840,7 @@ class GameState:
         Returns:
             Point value for the word
         """
-        if tile_count <= 4:
-            return 1
-        elif tile_count == 5:
-            return 2
-        elif tile_count == 6:
-            return 3
-        elif tile_count == 7:
-            return 5
-        else:
-            return 11
+        return PTS_TABLE[min(tile_count, 16)]
 
     def submit_word(self):
         """
@@ -384,38 +852,33 @@ class GameState:
         if not self.selected_path:
             return False
 
-        # Build word string from selected path
-        word = "".join(
-            self.board[r * GRID_SIZE + c].replace("Qu", "QU")
-            for r, c in self.selected_path
-        ).upper()
-
-        # Check if word already found
-        found_word_strings = [w for w, tc in self.found_words]
+        # The word string is maintained incrementally by select_letter
+        word = self.current_word
 
-        if self.is_valid_word(word, self.selected_path) and word not in found_word_strings:
-            # Valid new word! Store word with its tile count
+        if word not in self._found_set and self.is_valid_word(word, self.selected_path):
+            # Valid new word! Store the word with its tile count and point
+            # value so the word list never recomputes scores while drawing
             tile_count = len(self.selected_path)
-            self.found_words.append((word, tile_count))
-
-            # Calculate and add score
-            self.score += self.calculate_score(tile_count)
+            pts = self.calculate_score(tile_count)
+            self.found_words.append((word, tile_count, pts))
+            self._found_set.add(word)
+            self.found_content_h = len(self.found_words) * WORD_LINE_HEIGHT
+            self.score += pts
 
             # Auto-scroll to show new word at bottom
-            self.scroll_offset = -max(0, len(self.found_words) * WORD_LINE_HEIGHT - WORDS_AREA_HEIGHT)
+            self.scroll_offset = -max(0, self.found_content_h - WORDS_AREA_HEIGHT)
 
             self.selected_path = []
+            self.current_word = ""
             return True
 
         self.selected_path = []
+        self.current_word = ""
         return False
 
     def get_current_word(self):
         """Get the word currently being built from selected path."""
-        return "".join(
-            self.board[r * GRID_SIZE + c].replace("Qu", "QU")
-            for r, c in self.selected_path
-        ).upper()
+        return self.current_word
 
     # ───────────────────────────────────────────────────────────────────────
     # TIMER MANAGEMENT
@@ -438,6 +901,7 @@ class GameState:
         self.total_elapsed = 0
         self.timer_start = 0
         self.selected_path = []
+        self.current_word = ""
 
     def get_time_left(self):
         """
@@ -446,14 +910,14 @@ class GameState:
         Returns:
             Seconds remaining (0 if timer expired)
         """
-        if self.timer_active:
-            current_elapsed = time.time() - self.timer_start + self.total_elapsed
-            time_left = max(0, TIME_LIMIT - int(current_elapsed))
-            if time_left <= 0:
-                self.timer_active = False
-            return time_left
-        else:
-            return max(0, TIME_LIMIT - int(self.total_elapsed))
+        elapsed = (
+            time.time() - self.timer_start + self.total_elapsed
+            if self.timer_active else self.total_elapsed
+        )
+        time_left = max(0, TIME_LIMIT - int(elapsed))
+        if time_left <= 0:
+            self.timer_active = False
+        return time_left
 
     # ───────────────────────────────────────────────────────────────────────
     # WORD SELECTION
@@ -470,18 +934,22 @@ class GameState:
             True if selection was valid, False otherwise
         """
         pos = (row, col)
+        tile_text = self.board_letters[row * GRID_SIZE + col]
 
         if not self.selected_path:
             # Start new word
             self.selected_path = [pos]
+            self.current_word = tile_text
             return True
         elif pos == self.selected_path[0]:
             # Clicked first letter again - clear selection
             self.selected_path = []
+            self.current_word = ""
             return True
         elif pos not in self.selected_path and self.is_adjacent(self.selected_path[-1], pos):
             # Add adjacent letter to word
             self.selected_path.append(pos)
+            self.current_word += tile_text
             return True
 
         return False
@@ -521,55 +989,33 @@ class GameState:
     def _find_all_possible_words(self):
         """
         Find all valid words that can be formed on the current board.
-        Uses depth-first search with prefix pruning for efficiency.
+        Delegates to the memoized module-level solver.
 
         Returns:
             Sorted list of all possible words
         """
-        board = self.board
-
-        def get_letter(idx):
-            """Get letter at index, converting 'Qu' to 'QU'"""
-            return "QU" if board[idx] == "Qu" else board[idx]
-
-        def dfs(pos, visited, current_word):
-            """Depth-first search to find words starting from position."""
-            if len(current_word) > 16:
-                return
-
-            letter = get_letter(pos)
-            current_word += letter
+        return list(_solve_board(self.board))
 
-            # Prune: if no dictionary word starts with this prefix, stop
-            if current_word not in prefixes:
-                return
-
-            # If we found a valid word, add it to results
-            if len(current_word) >= 3 and current_word in dictionary:
-                found.add(current_word)
-
-            # Explore all adjacent positions
-            r, c = divmod(pos, GRID_SIZE)
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == dc == 0:
-                        continue
+    @property
+    def solver_pending(self):
+        """True while a background board solve has not completed yet."""
+        return self._solve_future is not None
 
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < 4 and 0 <= nc < 4:
-                        new_pos = nr * 4 + nc
-                        if new_pos not in visited:
-                            visited.add(new_pos)
-                            dfs(new_pos, visited, current_word)
-                            visited.remove(new_pos)
-
-        # Try starting from each position on the board
-        found = set()
-        for start_pos in range(16):
-            visited = {start_pos}
-            dfs(start_pos, visited, "")
+    def poll_solver(self):
+        """
+        Adopt the background solve result once it is ready.
+        Called once per frame from the main loop; a cheap no-op when no
+        solve is pending.
 
-        return sorted(found)
+        Returns:
+            True if a result was adopted this call, False otherwise
+        """
+        if self._solve_future is not None and self._solve_future.done():
+            self.possible_words = list(self._solve_future.result())
+            self.cheat_content_h = len(self.possible_words) * CHEAT_LINE_H
+            self._solve_future = None
+            return True
+        return False
 
     def find_path_for_word(self, target):
         """
@@ -583,49 +1029,42 @@ class GameState:
             List of (row, col) positions forming the word, or None if not found
         """
         target = target.upper()
-        board = self.board
-
-        def get_letter(idx):
-            """Get letter at index, converting 'Qu' to 'QU'"""
-            return "QU" if board[idx] == "Qu" else board[idx]
-
-        def dfs(pos, path, current):
-            """Depth-first search to find path for target word."""
-            if current == target:
+        target_len = len(target)
+        board_letters = self.board_letters
+
+        # Hot names are bound as default args so every read inside the
+        # recursion is a LOAD_FAST instead of a global/closure lookup
+        def dfs(pos, path, i, visited_mask, _letters=board_letters,
+                _neighbors=NEIGHBORS, _pos_rc=POS_RC, _target=target,
+                _target_len=target_len):
+            """Depth-first search to find path for target word; i is the
+            number of target characters already matched."""
+            if i == _target_len:
                 return path[:]
 
-            if len(current) >= len(target):
-                return None
-
-            r, c = divmod(pos, GRID_SIZE)
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    if dr == dc == 0:
-                        continue
-
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < 4 and 0 <= nc < 4:
-                        np_idx = nr * 4 + nc
-
-                        if np_idx not in {p[0] * 4 + p[1] for p in path}:
-                            next_l = get_letter(np_idx)
-                            new = current + next_l
-
-                            if target.startswith(new):
-                                path.append((nr, nc))
-                                res = dfs(np_idx, path, new)
-                                if res:
-                                    return res
-                                path.pop()
+            # Visited cells ride along as a 16-bit mask, replacing the set
+            # that was rebuilt from the whole path on every neighbor probe
+            for np_idx in _neighbors[pos]:
+                if not (visited_mask >> np_idx) & 1:
+                    next_l = _letters[np_idx]
+                    step = i + len(next_l)
+
+                    # Compare the next tile against its target slice; no
+                    # prefix string is concatenated or rescanned
+                    if step <= _target_len and _target[i:step] == next_l:
+                        path.append(_pos_rc[np_idx])
+                        res = dfs(np_idx, path, step, visited_mask | (1 << np_idx))
+                        if res:
+                            return res
+                        path.pop()
 
             return None
 
         # Try starting from each position
         for start in range(16):
-            start_l = get_letter(start)
-            if target.startswith(start_l):
-                sr, sc = divmod(start, 4)
-                res = dfs(start, [(sr, sc)], start_l)
+            start_l = board_letters[start]
+            if target[:len(start_l)] == start_l:
+                res = dfs(start, [POS_RC[start]], len(start_l), 1 << start)
                 if res:
                     return res
 
@@ -643,7 +1082,7 @@ class GameState:
             Dictionary containing all game state
         """
         return {
-            'board': self.board,
+            'board': list(self.board),
             'found_words': self.found_words,
             'score': self.score,
             'total_elapsed': self.total_elapsed + (
@@ -663,11 +1102,26 @@ class GameState:
             New GameState instance
         """
         game = cls()
-        game.board = data['board']
-        game.found_words = data['found_words']
+        # Serialized boards come back as lists; restore the tuple form the
+        # solver cache keys on
+        game.board = tuple(data['board'])
+        game.board_letters = ["QU" if l == "Qu" else l for l in game.board]
+        # Older saves stored (word, tile_count) pairs without the point
+        # value; recompute it where missing
+        game.found_words = [
+            (entry[0], entry[1],
+             entry[2] if len(entry) > 2 else cls.calculate_score(entry[1]))
+            for entry in data['found_words']
+        ]
+        game._found_set = {entry[0] for entry in game.found_words}
+        game.found_content_h = len(game.found_words) * WORD_LINE_HEIGHT
         game.score = data['score']
         game.total_elapsed = data['total_elapsed']
+        # The board was replaced, so discard the reset() solve and resolve
+        # the restored board synchronously
+        game._solve_future = None
         game.possible_words = game._find_all_possible_words()
+        game.cheat_content_h = len(game.possible_words) * CHEAT_LINE_H
         return game
 
 
@@ -718,7 +1172,7 @@ except Exception as e:
 # WINDOW INITIALIZATION
 # Set up the main game window with initial size and caption.
 # ───────────────────────────────────────────────────────────────────────────
-screen = pygame.display.set_mode((BASE_WIDTH, SCREEN_HEIGHT))
+screen = set_display_mode((BASE_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Woggle - An Oddly Familiar Word Game")
 
 # Set custom window icon (optional - file must exist)
@@ -731,7 +1185,48 @@ except:
 # ───────────────────────────────────────────────────────────────────────────
 # CREATE GAME INSTANCE
 # ───────────────────────────────────────────────────────────────────────────
+# Cell chrome baked once per fill color (default, selected, cheat path)
+# in the display's pixel format, so every cell draw is two fast blits
+_cell_surfaces = {
+    color: _build_cell_surface(color) for color in (WHITE, YELLOW, CHEAT_HIGHLIGHT)
+}
+
 game = GameState()
+grid_static = build_grid_surface(game.board)
+
+# Button descriptors with fully baked surfaces: fill, border, and label
+# are composited once per state at init, so drawing a button each frame
+# is one collidepoint and one blit. The two state-dependent buttons get
+# one variant per state, indexed by the relevant flag.
+Button = collections.namedtuple("Button", ["rect", "base", "hover"])
+
+
+def _bake_button_surface(rect, label, color):
+    surf = pygame.Surface(rect.size).convert()
+    surf.fill(color)
+    pygame.draw.rect(surf, BLACK, surf.get_rect(), 3)
+    surf.blit(label, label.get_rect(center=surf.get_rect().center))
+    return surf
+
+
+def _make_button(rect, text, base, hover):
+    label = render_cached(button_font, text, WHITE)
+    return Button(rect,
+                  _bake_button_surface(rect, label, base),
+                  _bake_button_surface(rect, label, hover))
+
+
+SUBMIT_BUTTON = _make_button(submit_rect, "Submit Word", BLUE, DARK_BLUE)
+RESET_BUTTON = _make_button(timer_reset_rect, "Reset Timer", BLUE, DARK_BLUE)
+RESHUFFLE_BUTTON = _make_button(reshuffle_rect, "Re-shuffle", BLUE, DARK_BLUE)
+TIMER_BUTTONS = (  # indexed by game.timer_active
+    _make_button(timer_toggle_rect, "Timer Start/Stop", BLUE, DARK_BLUE),
+    _make_button(timer_toggle_rect, "Timer Start/Stop", DARK_BLUE, (40, 80, 170)),
+)
+CHEAT_BUTTONS = (  # indexed by game.cheat_visible
+    _make_button(cheat_rect, "Cheat", RED, (180, 30, 30)),
+    _make_button(cheat_rect, "Hide Cheat", DARK_BLUE, (40, 80, 170)),
+)
 
 # Scrollbar UI constants
 scrollbar_width = 10
@@ -744,6 +1239,7 @@ scrollbar_x = BASE_WIDTH - scrollbar_width - 15  # Position inside the word list
 
 running = True
 clock = pygame.time.Clock()
+prev_time_left = None  # None forces a full paint on the first frame
 
 while running:
     # ───────────────────────────────────────────────────────────────────────
@@ -751,7 +1247,21 @@ while running:
     # Process all Pygame events, including mouse clicks, drags, and wheel scrolls.
     # ───────────────────────────────────────────────────────────────────────
 
-    for event in pygame.event.get():
+    # Block in the OS until an event arrives (or ~one frame elapses so the
+    # timer can still tick) instead of spinning the loop at 60 Hz while
+    # idle, then drain whatever else is queued.
+    first = pygame.event.wait(16)
+    events = [first] if first.type != pygame.NOEVENT else []
+    events += pygame.event.get()
+
+    had_event = False
+    # High-polling mice can queue dozens of motion/wheel events per frame;
+    # only the final pointer position and the summed wheel delta matter, so
+    # they are coalesced here and applied once after the loop
+    motion_pos = None
+    wheel_y = 0
+    for event in events:
+        had_event = True
         if event.type == pygame.QUIT:
             running = False
 
@@ -765,7 +1275,7 @@ while running:
             # ───────────────────────────────────────────────────────────────
             # BOARD LETTER SELECTION
             # ───────────────────────────────────────────────────────────────
-            if mx < GRID_WIDTH and my < GRID_SIZE * CELL_SIZE + 40:
+            if mx < GRID_WIDTH and my < GRID_AREA_HEIGHT:
                 adjusted_mx = mx - 20
                 adjusted_my = my - 20
 
@@ -774,37 +1284,38 @@ while running:
                     row = adjusted_my // CELL_SIZE
 
                     if not game.select_letter(row, col):
-                        buzzer_sound.play()
+                        play_buzzer()
 
             # ───────────────────────────────────────────────────────────────
             # SUBMIT WORD BUTTON
             # ───────────────────────────────────────────────────────────────
             if submit_rect.collidepoint(mx, my) and game.selected_path:
                 if game.submit_word():
-                    ding_sound.play()
+                    play_ding()
                 else:
-                    buzzer_sound.play()
+                    play_buzzer()
 
             # ───────────────────────────────────────────────────────────────
             # TIMER START/STOP BUTTON
             # ───────────────────────────────────────────────────────────────
             if timer_toggle_rect.collidepoint(mx, my):
                 game.toggle_timer()
-                ding_sound.play()
+                play_ding()
 
             # ───────────────────────────────────────────────────────────────
             # RESET TIMER BUTTON
             # ───────────────────────────────────────────────────────────────
             if timer_reset_rect.collidepoint(mx, my):
                 game.reset_timer()
-                ding_sound.play()
+                play_ding()
 
             # ───────────────────────────────────────────────────────────────
             # RE-SHUFFLE BUTTON
             # ───────────────────────────────────────────────────────────────
             if reshuffle_rect.collidepoint(mx, my):
                 game.reshuffle()
-                ding_sound.play()
+                grid_static = build_grid_surface(game.board)
+                play_ding()
 
             # ───────────────────────────────────────────────────────────────
             # CHEAT BUTTON
@@ -813,39 +1324,32 @@ while running:
                 game.toggle_cheat()
 
                 if game.cheat_visible:
-                    screen = pygame.display.set_mode((BASE_WIDTH + CHEAT_PANEL_WIDTH, SCREEN_HEIGHT))
+                    screen = set_display_mode((BASE_WIDTH + CHEAT_PANEL_WIDTH, SCREEN_HEIGHT))
                     pygame.display.set_caption("Woggle – An Oddly Familiar Word Game - Cheat Mode")
                 else:
-                    screen = pygame.display.set_mode((BASE_WIDTH, SCREEN_HEIGHT))
+                    screen = set_display_mode((BASE_WIDTH, SCREEN_HEIGHT))
                     pygame.display.set_caption("Woggle - An Oddly Familiar Word Game")
 
-                ding_sound.play()
+                play_ding()
 
             # ───────────────────────────────────────────────────────────────
             # MAIN PANEL SCROLLBAR
             # ───────────────────────────────────────────────────────────────
-            if len(game.found_words) * WORD_LINE_HEIGHT > WORDS_AREA_HEIGHT:
-                content_h = len(game.found_words) * WORD_LINE_HEIGHT
-                max_scroll = content_h - WORDS_AREA_HEIGHT
-                if content_h > 0 and max_scroll > 0:
-                    thumb_h = max(30, (WORDS_AREA_HEIGHT / content_h) * WORDS_AREA_HEIGHT)
-                    thumb_y = WORDS_AREA_Y + (-game.scroll_offset / max_scroll) * (WORDS_AREA_HEIGHT - thumb_h)
-                    sb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_h)
-                    if sb_rect.collidepoint(mx, my):
-                        game.dragging_scrollbar = True
+            sb = compute_scrollbar(game.found_content_h, WORDS_AREA_HEIGHT,
+                                   WORDS_AREA_Y, game.scroll_offset)
+            if sb.visible:
+                sb_rect = pygame.Rect(scrollbar_x, sb.thumb_y, scrollbar_width, sb.thumb_h)
+                if sb_rect.collidepoint(mx, my):
+                    game.dragging_scrollbar = True
 
             # ───────────────────────────────────────────────────────────────
             # CHEAT PANEL SCROLLBAR
             # ───────────────────────────────────────────────────────────────
             if game.cheat_visible:
-                cheat_top = 65
-                cheat_h = SCREEN_HEIGHT - 95
-                content_h = len(game.possible_words) * 24
-                max_scroll = content_h - cheat_h
-                if content_h > cheat_h and max_scroll > 0:
-                    thumb_h = max(30, (cheat_h / content_h) * cheat_h)
-                    thumb_y = cheat_top + (-game.cheat_scroll_offset / max_scroll) * (cheat_h - thumb_h)
-                    sb_rect = pygame.Rect(BASE_WIDTH + CHEAT_PANEL_WIDTH - 20, thumb_y, 14, thumb_h)
+                sb = compute_scrollbar(game.cheat_content_h, CHEAT_H,
+                                       CHEAT_TOP, game.cheat_scroll_offset)
+                if sb.visible:
+                    sb_rect = pygame.Rect(CHEAT_SB_X, sb.thumb_y, 14, sb.thumb_h)
                     if sb_rect.collidepoint(mx, my):
                         game.cheat_dragging_scrollbar = True
                         continue
@@ -854,19 +1358,13 @@ while running:
             # CHEAT WORD SELECTION
             # ───────────────────────────────────────────────────────────────
             if game.cheat_visible and mx >= BASE_WIDTH and not game.cheat_dragging_scrollbar:
-                cheat_top = 65
-                line_h = 24
-                cheat_h = SCREEN_HEIGHT - 95
-
-                cheat_area = pygame.Rect(BASE_WIDTH + 5, cheat_top, CHEAT_PANEL_WIDTH - 30, cheat_h)
-                if cheat_area.collidepoint(mx, my):
-                    for i, word in enumerate(game.possible_words):
-                        y = cheat_top + i * line_h + game.cheat_scroll_offset
-                        if cheat_top <= y <= cheat_top + cheat_h - line_h:
-                            if y <= my <= y + line_h:
-                                game.select_cheat_word(word)
-                                ding_sound.play()
-                                break
+                if CHEAT_CLICK_RECT.collidepoint(mx, my):
+                    # Map the click straight to its row index; the old loop
+                    # scanned the whole word list to find the row under my
+                    i = int((my - CHEAT_TOP - game.cheat_scroll_offset) // CHEAT_LINE_H)
+                    if 0 <= i < len(game.possible_words):
+                        game.select_cheat_word(game.possible_words[i])
+                        play_ding()
 
         # ───────────────────────────────────────────────────────────────────
         # MOUSE BUTTON RELEASE
@@ -879,237 +1377,232 @@ while running:
         # MOUSE MOTION (DRAGGING)
         # ───────────────────────────────────────────────────────────────────
         elif event.type == pygame.MOUSEMOTION:
-            mx, my = event.pos
-
-            if game.dragging_scrollbar:
-                content_h = len(game.found_words) * WORD_LINE_HEIGHT
-                if content_h > 0:
-                    thumb_h = max(30, (WORDS_AREA_HEIGHT / content_h) * WORDS_AREA_HEIGHT)
-                    max_off = content_h - WORDS_AREA_HEIGHT
-                    rel_y = my - WORDS_AREA_Y - thumb_h / 2
-                    if WORDS_AREA_HEIGHT - thumb_h > 0:
-                        ratio = max(0, min(1, rel_y / (WORDS_AREA_HEIGHT - thumb_h)))
-                        game.scroll_offset = -(ratio * max_off)
-
-            if game.cheat_dragging_scrollbar and game.cheat_visible:
-                cheat_top = 65
-                cheat_h = SCREEN_HEIGHT - 95
-                content_h = len(game.possible_words) * 24
-                if content_h > 0:
-                    thumb_h = max(30, (cheat_h / content_h) * cheat_h)
-                    max_off = content_h - cheat_h
-                    rel_y = my - cheat_top - thumb_h / 2
-                    if cheat_h - thumb_h > 0:
-                        ratio = max(0, min(1, rel_y / (cheat_h - thumb_h)))
-                        game.cheat_scroll_offset = -(ratio * max_off)
+            motion_pos = event.pos
 
         # ───────────────────────────────────────────────────────────────────
         # MOUSE WHEEL SCROLLING
         # ───────────────────────────────────────────────────────────────────
         elif event.type == pygame.MOUSEWHEEL:
-            mx, my = pygame.mouse.get_pos()
-
-            if game.cheat_visible and mx >= BASE_WIDTH:
-                game.cheat_scroll_offset += event.y * 35
-                cheat_h = SCREEN_HEIGHT - 95
-                max_off = -max(0, len(game.possible_words) * 24 - cheat_h)
-                game.cheat_scroll_offset = max(max_off, min(0, game.cheat_scroll_offset))
-            else:
-                game.scroll_offset += event.y * 35
-                max_off = -max(0, len(game.found_words) * WORD_LINE_HEIGHT - WORDS_AREA_HEIGHT)
-                game.scroll_offset = max(max_off, min(0, game.scroll_offset))
+            wheel_y += event.y
+
+    # ───────────────────────────────────────────────────────────────────────
+    # COALESCED MOTION / WHEEL HANDLING
+    # Scrollbar drags track the last pointer position of the frame; wheel
+    # scrolling applies the frame's summed delta in one clamp.
+    # ───────────────────────────────────────────────────────────────────────
+    if motion_pos is not None:
+        mx, my = motion_pos
+
+        if game.dragging_scrollbar:
+            sb = compute_scrollbar(game.found_content_h, WORDS_AREA_HEIGHT,
+                                   WORDS_AREA_Y, game.scroll_offset)
+            if sb.visible and WORDS_AREA_HEIGHT - sb.thumb_h > 0:
+                rel_y = my - WORDS_AREA_Y - sb.thumb_h / 2
+                ratio = max(0, min(1, rel_y / (WORDS_AREA_HEIGHT - sb.thumb_h)))
+                game.scroll_offset = -(ratio * sb.max_scroll)
+
+        if game.cheat_dragging_scrollbar and game.cheat_visible:
+            sb = compute_scrollbar(game.cheat_content_h, CHEAT_H,
+                                   CHEAT_TOP, game.cheat_scroll_offset)
+            if sb.visible and CHEAT_H - sb.thumb_h > 0:
+                rel_y = my - CHEAT_TOP - sb.thumb_h / 2
+                ratio = max(0, min(1, rel_y / (CHEAT_H - sb.thumb_h)))
+                game.cheat_scroll_offset = -(ratio * sb.max_scroll)
+
+    if wheel_y:
+        mx, my = pygame.mouse.get_pos()
+
+        if game.cheat_visible and mx >= BASE_WIDTH:
+            sb = compute_scrollbar(game.cheat_content_h, CHEAT_H,
+                                   CHEAT_TOP, game.cheat_scroll_offset)
+            game.cheat_scroll_offset = max(
+                -sb.max_scroll, min(0, game.cheat_scroll_offset + wheel_y * 35))
+        else:
+            sb = compute_scrollbar(game.found_content_h, WORDS_AREA_HEIGHT,
+                                   WORDS_AREA_Y, game.scroll_offset)
+            game.scroll_offset = max(
+                -sb.max_scroll, min(0, game.scroll_offset + wheel_y * 35))
 
     # ───────────────────────────────────────────────────────────────────────
-    # TIMER LOGIC
+    # BACKGROUND SOLVER AND TIMER LOGIC
     # ───────────────────────────────────────────────────────────────────────
+    solver_updated = game.poll_solver()
     time_left = game.get_time_left()
 
     # Countdown sounds (last 4 seconds)
-    if game.timer_active and time_left in (1, 2, 3, 4):
+    if game.timer_active and 0 < time_left <= 4:
         if time_left != game.last_countdown_second:
-            ding_sound.play()
+            play_ding()
             game.last_countdown_second = time_left
     elif time_left == 0 and not game.timer_active:
         if game.last_countdown_second != 0:
-            buzzer_sound.play()
+            play_buzzer()
             game.last_countdown_second = 0
 
     # ═══════════════════════════════════════════════════════════════════════
     # RENDERING
     # ═══════════════════════════════════════════════════════════════════════
 
-    screen.fill(WHITE)
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW BOARD GRID
-    # ───────────────────────────────────────────────────────────────────────
-    grid_background = pygame.Rect(0, 0, GRID_WIDTH, GRID_SIZE * CELL_SIZE + 40)
-    pygame.draw.rect(screen, BLACK, grid_background)
-
-    grid_border = pygame.Rect(0, 0, GRID_WIDTH, GRID_SIZE * CELL_SIZE + 40)
-    draw_rounded_rect(screen, BLACK, grid_border, border_radius=15, border_width=20, border_color=NAVY_BLUE)
-
-    for row in range(GRID_SIZE):
-        for col in range(GRID_SIZE):
-            rect = pygame.Rect(col * CELL_SIZE + 20, row * CELL_SIZE + 20, CELL_SIZE, CELL_SIZE)
-            pos = (row, col)
-
-            if pos in game.selected_path_from_cheat:
-                color = (255, 220, 100)
-            elif pos in game.selected_path:
-                color = YELLOW
-            else:
-                color = WHITE
-
-            draw_rounded_rect(screen, color, rect, border_radius=15, border_width=2, border_color=GRAY)
-
-            inner_rect = pygame.Rect(rect.x + 10, rect.y + 10, rect.width - 20, rect.height - 20)
-            draw_rounded_rect(screen, color, inner_rect, border_radius=10, border_width=4, border_color=LIGHT_GRAY)
-
-            letter = game.board[row * GRID_SIZE + col]
-            text = font.render(letter, True, BLACK)
-            screen.blit(text, text.get_rect(center=rect.center))
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW CHEAT PATH LINES
-    # ───────────────────────────────────────────────────────────────────────
-    if game.selected_path_from_cheat:
-        for i in range(len(game.selected_path_from_cheat) - 1):
-            r1, c1 = game.selected_path_from_cheat[i]
-            r2, c2 = game.selected_path_from_cheat[i + 1]
-
-            x1 = c1 * CELL_SIZE + CELL_SIZE // 2 + 20
-            y1 = r1 * CELL_SIZE + CELL_SIZE // 2 + 20
-            x2 = c2 * CELL_SIZE + CELL_SIZE // 2 + 20
-            y2 = r2 * CELL_SIZE + CELL_SIZE // 2 + 20
-
-            pygame.draw.line(screen, (0, 255, 32), (x1, y1), (x2, y2), 6)
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW SIDEBAR
-    # ───────────────────────────────────────────────────────────────────────
-    x = GRID_WIDTH + 20
-
-    current = game.get_current_word()
-    screen.blit(small_font.render("Word: " + current, True, BLACK), (x, 20))
-
-    screen.blit(small_font.render("Found:", True, GREEN), (x, WORDS_AREA_Y - 20))
-
-    area_rect = pygame.Rect(x - 10, WORDS_AREA_Y, WORDS_AREA_WIDTH + 20, WORDS_AREA_HEIGHT)
-    pygame.draw.rect(screen, WHITE, area_rect)
-    pygame.draw.rect(screen, GRAY, area_rect, 1)
-
-    for i, (w, tile_count) in enumerate(game.found_words):
-        y_pos = WORDS_AREA_Y + i * WORD_LINE_HEIGHT + game.scroll_offset
-        if WORDS_AREA_Y <= y_pos <= WORDS_AREA_Y + WORDS_AREA_HEIGHT - WORD_LINE_HEIGHT:
-            pts = GameState.calculate_score(tile_count)
-
-            screen.blit(small_font.render(w, True, BLACK), (x + 5, y_pos))
-
-            pts_text = small_font.render(str(pts), True, (100, 100, 100))
-            screen.blit(pts_text, (x + WORDS_AREA_WIDTH - 40, y_pos))
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW MAIN SCROLLBAR
-    # ───────────────────────────────────────────────────────────────────────
-    if len(game.found_words) * WORD_LINE_HEIGHT > WORDS_AREA_HEIGHT:
-        content_h = len(game.found_words) * WORD_LINE_HEIGHT
-        max_scroll = content_h - WORDS_AREA_HEIGHT
-        if content_h > 0 and max_scroll > 0:
-            thumb_h = max(30, (WORDS_AREA_HEIGHT / content_h) * WORDS_AREA_HEIGHT)
-            thumb_y = WORDS_AREA_Y + (-game.scroll_offset / max_scroll) * (WORDS_AREA_HEIGHT - thumb_h)
-            sb_rect = pygame.Rect(scrollbar_x, thumb_y, scrollbar_width, thumb_h)
-
-            color = SCROLLBAR_ACTIVE if sb_rect.collidepoint(pygame.mouse.get_pos()) or game.dragging_scrollbar else SCROLLBAR_COLOR
+    # A full repaint only happens when something visible may have changed:
+    # a handled event or a freshly adopted solve result. When just the
+    # timer second ticked, only the status block is repainted and
+    # presented; otherwise the frame's drawing is skipped entirely.
+    if had_event or solver_updated or prev_time_left is None:
+        prev_time_left = time_left
+        # One SDL query per frame; every hover check below reuses it.
+        # The coarse per-column tests gate the scrollbar thumb hover checks:
+        # the exact collidepoint only runs when the mouse is in the narrow
+        # band a scrollbar occupies.
+        mouse_pos = pygame.mouse.get_pos()
+        mouse_near_main_sb = scrollbar_x <= mouse_pos[0] <= scrollbar_x + scrollbar_width
+        mouse_near_cheat_sb = mouse_pos[0] >= CHEAT_SB_X
+        screen.fill(WHITE)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW BOARD GRID
+        # ───────────────────────────────────────────────────────────────────────
+        screen.blit(grid_static, (0, 0))
+
+        # Overpaint only the highlighted cells. Folding both paths into one
+        # dict keeps the cheat color winning when a cell is in both (the
+        # later insertion overwrites) and draws each cell at most once.
+        # The whole dynamic pass is clipped to the grid area once so every
+        # sub-draw is bounded by SDL in C rather than checked in Python.
+        highlights = dict.fromkeys(game.selected_path, YELLOW)
+        highlights.update(dict.fromkeys(game.selected_path_from_cheat, CHEAT_HIGHLIGHT))
+
+        screen.set_clip(GRID_BG_RECT)
+        for (r, c), color in highlights.items():
+            draw_cell(screen, r, c, color, game.board)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW CHEAT PATH LINES
+        # ───────────────────────────────────────────────────────────────────────
+        if len(game.selected_path_from_cheat) > 1:
+            # One polyline call instead of a draw.line per segment: a single
+            # crossing into SDL for the whole path, identical pixels
+            pts = [CELL_CENTER[r][c] for r, c in game.selected_path_from_cheat]
+            pygame.draw.lines(screen, (0, 255, 32), False, pts, 6)
+        screen.set_clip(None)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW SIDEBAR
+        # ───────────────────────────────────────────────────────────────────────
+        x = GRID_WIDTH + 20
+
+        current = game.get_current_word()
+        screen.blit(render_cached(small_font, "Word: " + current, BLACK), (x, 20))
+
+        screen.blit(render_cached(small_font, "Found:", GREEN), (x, WORDS_AREA_Y - 20))
+
+        pygame.draw.rect(screen, WHITE, WORDS_AREA_RECT)
+        pygame.draw.rect(screen, GRAY, WORDS_AREA_RECT, 1)
+
+        # Collect the visible entries and push them to SDL in one blits call
+        # (doreturn=0 skips building the changed-rect list) instead of paying
+        # a Python-level blit per word and per point value.
+        # Only the index range that can intersect the viewport is walked, so
+        # the cost is O(visible rows) regardless of how many words are found;
+        # rows straddling the area's edges are cropped by the clip rect in C
+        # rather than popping in and out on a Python bounds test.
+        found_blits = []
+        first = max(0, int(-game.scroll_offset // WORD_LINE_HEIGHT))
+        last = min(len(game.found_words),
+                   first + WORDS_AREA_HEIGHT // WORD_LINE_HEIGHT + 2)
+        for i in range(first, last):
+            w, tile_count, pts = game.found_words[i]
+            y_pos = WORDS_AREA_Y + i * WORD_LINE_HEIGHT + game.scroll_offset
+            found_blits.append((render_cached(small_font, w, BLACK), (x + 5, y_pos)))
+            found_blits.append((render_cached(small_font, str(pts), (100, 100, 100)),
+                                (x + WORDS_AREA_WIDTH - 40, y_pos)))
+        if found_blits:
+            screen.set_clip(WORDS_CLIP_RECT)
+            screen.blits(found_blits, doreturn=0)
+            screen.set_clip(None)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW MAIN SCROLLBAR
+        # ───────────────────────────────────────────────────────────────────────
+        main_sb = compute_scrollbar(game.found_content_h, WORDS_AREA_HEIGHT,
+                                    WORDS_AREA_Y, game.scroll_offset)
+        if main_sb.visible:
+            sb_rect = pygame.Rect(scrollbar_x, main_sb.thumb_y, scrollbar_width, main_sb.thumb_h)
+
+            hovered = mouse_near_main_sb and sb_rect.collidepoint(mouse_pos)
+            color = SCROLLBAR_ACTIVE if hovered or game.dragging_scrollbar else SCROLLBAR_COLOR
             pygame.draw.rect(screen, color, sb_rect)
             pygame.draw.rect(screen, BLACK, sb_rect, 1)
 
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW STATUS TEXT
-    # ───────────────────────────────────────────────────────────────────────
-    bottom_y = GRID_SIZE * CELL_SIZE + 70
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW STATUS TEXT
+        # ───────────────────────────────────────────────────────────────────────
+        draw_status(screen, game, time_left)
 
-    screen.blit(small_font.render(f"Score: {game.score}", True, BLACK), (x, bottom_y))
-    screen.blit(small_font.render(f"Words possible: {len(game.possible_words)}",
-                                  True, (90, 90, 140)), (x, bottom_y + 60))
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW CHEAT PANEL
+        # ───────────────────────────────────────────────────────────────────────
+        if game.cheat_visible:
+            cheat_x = BASE_WIDTH + 15
 
-    timer_str = f"Time: {time_left // 60:02d}:{time_left % 60:02d}"
-    timer_color = RED if time_left <= 30 and game.timer_active else BLACK
-    screen.blit(small_font.render(timer_str, True, timer_color), (x, bottom_y + 30))
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW CHEAT PANEL
-    # ───────────────────────────────────────────────────────────────────────
-    cheat_text = "Hide Cheat" if game.cheat_visible else "Cheat"
-    cheat_color = DARK_BLUE if game.cheat_visible else RED
-
-    if game.cheat_visible:
-        cheat_x = BASE_WIDTH + 15
+            pygame.draw.rect(screen, (235, 235, 255), CHEAT_PANEL_RECT)
+            pygame.draw.line(screen, GRAY, (BASE_WIDTH, 0), (BASE_WIDTH, SCREEN_HEIGHT), 2)
 
-        pygame.draw.rect(screen, (235, 235, 255),
-                        (BASE_WIDTH, 0, CHEAT_PANEL_WIDTH, SCREEN_HEIGHT))
-        pygame.draw.line(screen, GRAY, (BASE_WIDTH, 0), (BASE_WIDTH, SCREEN_HEIGHT), 2)
+            screen.blit(render_cached(small_font, "Possible Words", DARK_BLUE), (cheat_x, 25))
 
-        screen.blit(small_font.render("Possible Words", True, DARK_BLUE), (cheat_x, 25))
+            pygame.draw.rect(screen, WHITE, CHEAT_AREA_RECT)
+            pygame.draw.rect(screen, GRAY, CHEAT_AREA_RECT, 1)
 
-        cheat_top = 65
-        cheat_h = SCREEN_HEIGHT - 95
-        cheat_area = pygame.Rect(BASE_WIDTH + 5, cheat_top, CHEAT_PANEL_WIDTH - 10, cheat_h)
-        pygame.draw.rect(screen, WHITE, cheat_area)
-        pygame.draw.rect(screen, GRAY, cheat_area, 1)
+            total = game.cheat_content_h
 
-        line_h = 24
-        total = len(game.possible_words) * line_h
+            if game.solver_pending:
+                screen.blit(render_cached(small_font, "Solving...", GRAY), (cheat_x, CHEAT_TOP + 10))
 
-        for i, word in enumerate(game.possible_words):
-            y = cheat_top + i * line_h + game.cheat_scroll_offset
-            if cheat_top <= y <= cheat_top + cheat_h - line_h:
+            # Same viewport culling and clip-cropping as the found-words
+            # list: possible_words routinely holds hundreds of entries,
+            # visible rows number ~20
+            cheat_blits = []
+            first = max(0, int(-game.cheat_scroll_offset // CHEAT_LINE_H))
+            last = min(len(game.possible_words), first + CHEAT_H // CHEAT_LINE_H + 2)
+            for i in range(first, last):
+                word = game.possible_words[i]
+                y = CHEAT_TOP + i * CHEAT_LINE_H + game.cheat_scroll_offset
                 color = (0, 100, 180) if word == game.selected_cheat_word else BLACK
-                screen.blit(small_font.render(word, True, color), (cheat_x, y))
-
-        if total > cheat_h and total > 0:
-            max_scroll = total - cheat_h
-            thumb_h = max(30, cheat_h / total * cheat_h)
-            thumb_y = cheat_top + (-game.cheat_scroll_offset / max_scroll) * (cheat_h - thumb_h)
-            sb_rect = pygame.Rect(BASE_WIDTH + CHEAT_PANEL_WIDTH - 20, thumb_y, 14, thumb_h)
-
-            color = SCROLLBAR_ACTIVE if sb_rect.collidepoint(pygame.mouse.get_pos()) or game.cheat_dragging_scrollbar else SCROLLBAR_COLOR
-            pygame.draw.rect(screen, color, sb_rect)
-            pygame.draw.rect(screen, BLACK, sb_rect, 1)
-
-    # ───────────────────────────────────────────────────────────────────────
-    # DRAW BUTTONS
-    # ───────────────────────────────────────────────────────────────────────
-    buttons = [
-        (submit_rect,       "Submit Word",       BLUE),
-        (timer_toggle_rect, "Timer Start/Stop",  DARK_BLUE if game.timer_active else BLUE),
-        (timer_reset_rect,  "Reset Timer",       BLUE),
-        (reshuffle_rect,    "Re-shuffle",        BLUE),
-        (cheat_rect,        cheat_text,          cheat_color)
-    ]
-
-    mouse_pos = pygame.mouse.get_pos()
-    for rect, text, base_color in buttons:
-        if rect.collidepoint(mouse_pos):
-            if rect == cheat_rect and base_color == RED:
-                color = (180, 30, 30)
-            elif base_color == DARK_BLUE:
-                color = (40, 80, 170)
-            else:
-                color = DARK_BLUE
-        else:
-            color = base_color
-
-        pygame.draw.rect(screen, color, rect)
-        pygame.draw.rect(screen, BLACK, rect, 3)
-
-        btn = button_font.render(text, True, WHITE)
-        screen.blit(btn, btn.get_rect(center=rect.center))
-
-    # ───────────────────────────────────────────────────────────────────────
-    # FLIP DISPLAY AND LIMIT FRAMERATE
-    # ───────────────────────────────────────────────────────────────────────
-    pygame.display.flip()
-    clock.tick(60)
+                cheat_blits.append((render_cached(small_font, word, color), (cheat_x, y)))
+            if cheat_blits:
+                screen.set_clip(CHEAT_CLIP_RECT)
+                screen.blits(cheat_blits, doreturn=0)
+                screen.set_clip(None)
+
+            cheat_sb = compute_scrollbar(total, CHEAT_H, CHEAT_TOP, game.cheat_scroll_offset)
+            if cheat_sb.visible:
+                sb_rect = pygame.Rect(CHEAT_SB_X, cheat_sb.thumb_y, 14, cheat_sb.thumb_h)
+
+                hovered = mouse_near_cheat_sb and sb_rect.collidepoint(mouse_pos)
+                color = SCROLLBAR_ACTIVE if hovered or game.cheat_dragging_scrollbar else SCROLLBAR_COLOR
+                pygame.draw.rect(screen, color, sb_rect)
+                pygame.draw.rect(screen, BLACK, sb_rect, 1)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # DRAW BUTTONS
+        # ───────────────────────────────────────────────────────────────────────
+        for b in (SUBMIT_BUTTON,
+                  TIMER_BUTTONS[game.timer_active],
+                  RESET_BUTTON,
+                  RESHUFFLE_BUTTON,
+                  CHEAT_BUTTONS[game.cheat_visible]):
+            screen.blit(b.hover if b.rect.collidepoint(mouse_pos) else b.base, b.rect)
+
+        # ───────────────────────────────────────────────────────────────────────
+        # FLIP DISPLAY AND LIMIT FRAMERATE
+        # ───────────────────────────────────────────────────────────────────────
+        pygame.display.flip()
+        # Cap only presented frames: idle iterations already sleep in
+        # event.wait above, and under vsync this is a no-op backstop for
+        # drivers where the vsync request was refused
+        clock.tick(60)
+    elif time_left != prev_time_left:
+        prev_time_left = time_left
+        draw_status(screen, game, time_left)
+        pygame.display.update(STATUS_RECT)
 
 pygame.quit()